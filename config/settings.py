@@ -1,52 +1,123 @@
 """
-Configuration management using Pydantic Settings
+Configuration management
 Environment-based configuration for production deployment
+Values are read once from the environment and an optional .env file
 """
 
-from functools import lru_cache
-from typing import Optional
-from pydantic_settings import BaseSettings
+import json
+import os
+from dataclasses import dataclass, fields
+from typing import Dict, Optional, Tuple
 
 
-class Settings(BaseSettings):
+def _read_env_file(path: str = ".env", encoding: str = "utf-8") -> Dict[str, str]:
+    """Parse KEY=VALUE lines from a .env file (missing file -> empty dict)"""
+    values: Dict[str, str] = {}
+    try:
+        with open(path, encoding=encoding) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, _, value = line.partition("=")
+                value = value.strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+                    value = value[1:-1]
+                values[key.strip().upper()] = value
+    except FileNotFoundError:
+        pass
+    return values
+
+
+def _parse_value(name: str, field_type, raw: str):
+    """Convert a raw environment string to the type of a settings field"""
+    try:
+        if field_type is bool:
+            lowered = raw.strip().lower()
+            if lowered in ("1", "true", "yes", "on"):
+                return True
+            if lowered in ("0", "false", "no", "off"):
+                return False
+            raise ValueError(raw)
+        if field_type is int:
+            return int(raw)
+        if field_type is float:
+            return float(raw)
+        if field_type == Tuple[str, ...]:
+            raw = raw.strip()
+            items = json.loads(raw) if raw.startswith("[") else raw.split(",")
+            return tuple(str(item).strip() for item in items if str(item).strip())
+        if field_type == Optional[str]:
+            return raw or None
+        return raw
+    except ValueError:
+        raise ValueError(f"Invalid value for setting {name.upper()}: {raw!r}") from None
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application configuration"""
-    
+
     # API Settings
     app_name: str = "OpenHealth AI Service"
     app_version: str = "1.0.0"
     debug: bool = False
     host: str = "0.0.0.0"
     port: int = 8000
-    
+    cors_origins: Tuple[str, ...] = ("http://localhost:8000", "http://127.0.0.1:8000")
+
     # Model Settings
     model_version: str = "v1"
     models_dir: str = "models"
     confidence_threshold: float = 0.75
-    
+    preload_models: bool = False
+    model_cache_size: int = 8
+
     # Monitoring Settings
     log_level: str = "INFO"
+    prediction_log_sample_rate: float = 1.0
     monitoring_enabled: bool = True
     metrics_enabled: bool = True
-    
+
     # External APIs
     google_api_key: Optional[str] = None
-    
+
     # Data Pipeline Settings
     data_validation_enabled: bool = True
     drift_detection_enabled: bool = True
     drift_threshold: float = 0.3
-    
+    drift_min_samples: int = 30
+
     # Performance Settings
     max_workers: int = 4
     request_timeout: int = 30
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    inference_max_batch_size: int = 16
+    inference_max_wait_ms: float = 20.0
+    inference_max_queue_size: int = 100
+
+    @classmethod
+    def from_env(cls, env_file: str = ".env") -> "Settings":
+        """
+        Build settings from environment variables (case-insensitive),
+        falling back to the .env file and then to the defaults above
+        """
+        env = _read_env_file(env_file)
+        env.update((key.upper(), value) for key, value in os.environ.items())
+
+        overrides = {}
+        for field in fields(cls):
+            raw = env.get(field.name.upper())
+            if raw is not None:
+                overrides[field.name] = _parse_value(field.name, field.type, raw)
+        return cls(**overrides)
+
+
+_settings: Optional[Settings] = None
 
 
-@lru_cache()
 def get_settings() -> Settings:
-    """Get cached settings instance"""
-    return Settings()
+    """Get the shared settings instance (created on first call)"""
+    global _settings
+    if _settings is None:
+        _settings = Settings.from_env()
+    return _settings
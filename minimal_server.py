@@ -6,10 +6,8 @@ from fastapi.responses import HTMLResponse
 
 app = FastAPI(title="HealthPlus AI")
 
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    # [Previous HTML with "HealthPulse AI" replacing "OpenHealth"]
-    return """
+# [Previous HTML with "HealthPulse AI" replacing "OpenHealth"]
+_ROOT_HTML = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -353,6 +351,17 @@ async def root():
 </html>
     """
 
+# Page is static, so encode it and build the response once at import
+_ROOT_HTML_BYTES = _ROOT_HTML.encode("utf-8")
+_ROOT_RESPONSE = HTMLResponse(
+    content=_ROOT_HTML_BYTES,
+    headers={"Cache-Control": "public, max-age=3600"}
+)
+
+@app.get("/", response_class=HTMLResponse)
+async def root():
+    return _ROOT_RESPONSE
+
 @app.get("/health")
 async def health():
     return {"status": "healthy", "service": "HealthPlus AI", "version": "1.0.0"}
@@ -0,0 +1,159 @@
+"""
+Dynamic request batching for model inference
+Concurrent requests are queued and merged into a single model.predict call
+"""
+
+import asyncio
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.monitoring.logger import logger
+
+
+class DynamicBatcher:
+    """
+    Collects inputs for one model and runs them as a single batch
+
+    A batch takes whatever is already queued when the worker picks up its
+    first item and is flushed as soon as no more requests are waiting, so a
+    lone request never sits out a batching window. It keeps collecting while
+    requests keep arriving, until max_batch_size items or max_latency_ms
+    after its first item. Inputs are merged per shape
+    (apart from the leading batch axis), so one odd-shaped request only runs
+    separately instead of failing the others. predict_fn receives the merged
+    array and must return something sliceable along the batch axis (an array
+    or a list of per-row results).
+    """
+
+    # Live batchers, so stop_batchers() can reach them without keeping
+    # short-lived ones (e.g. in tests) alive
+    _instances: "weakref.WeakSet[DynamicBatcher]" = weakref.WeakSet()
+
+    def __init__(
+        self,
+        model_name: str,
+        max_batch_size: int = 32,
+        max_latency_ms: float = 20.0,
+        predict_fn: Optional[Callable[[Any], Any]] = None,
+        max_queue_size: int = 0
+    ):
+        self.model_name = model_name
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000.0
+        self.max_queue_size = max_queue_size
+        self._predict_fn = predict_fn
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        DynamicBatcher._instances.add(self)
+
+    async def submit(self, inputs: Any) -> Any:
+        """
+        Queue inputs (with a leading batch axis) and wait for their predictions
+
+        Raises asyncio.QueueFull when max_queue_size requests are already waiting
+        """
+        self._ensure_worker()
+        future = self._loop.create_future()
+        self._queue.put_nowait((future, inputs))
+        return await future
+
+    async def stop(self):
+        """Cancel the background worker"""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _ensure_worker(self):
+        """Start the worker on the running loop if it isn't already there"""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._task = loop.create_task(self._worker())
+
+    async def _worker(self):
+        queue = self._queue
+        loop = self._loop
+        while True:
+            batch: List[Tuple[asyncio.Future, Any]] = [await queue.get()]
+            deadline = loop.time() + self.max_latency
+            while len(batch) < self.max_batch_size:
+                # Let handlers that are already running enqueue, then stop
+                # as soon as nothing else is waiting
+                await asyncio.sleep(0)
+                if queue.empty() or loop.time() >= deadline:
+                    break
+                while not queue.empty() and len(batch) < self.max_batch_size:
+                    batch.append(queue.get_nowait())
+
+            batch = [item for item in batch if not item[0].done()]
+            if not batch:
+                continue
+
+            try:
+                predict = self._predict_fn
+                if predict is None:
+                    from src.models.loader import model_loader
+                    predict = (await model_loader.get_model_async(self.model_name)).predict
+                outcomes = await asyncio.to_thread(
+                    self._predict_batch, predict, [inputs for _, inputs in batch]
+                )
+            except Exception as e:
+                outcomes = [(e, None)] * len(batch)
+
+            for (future, _), (error, result) in zip(batch, outcomes):
+                if future.done():
+                    continue
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(error)
+
+    def _predict_batch(
+        self, predict: Callable[[Any], Any], arrays: List[Any]
+    ) -> List[Tuple[Optional[Exception], Any]]:
+        """
+        Predict every queued input, one model call per input shape
+        Returns (error, result) per input; a failing call only fails its own group
+        """
+        import numpy as np
+
+        groups: Dict[tuple, List[int]] = {}
+        for index, inputs in enumerate(arrays):
+            groups.setdefault(np.shape(inputs)[1:], []).append(index)
+
+        outcomes: List[Tuple[Optional[Exception], Any]] = [(None, None)] * len(arrays)
+        for indices in groups.values():
+            members = [arrays[i] for i in indices]
+            try:
+                merged = members[0] if len(members) == 1 else np.concatenate(members, axis=0)
+                logger.debug("Running %s batch of %d", self.model_name, len(merged))
+                predictions = predict(merged)
+            except Exception as e:
+                for i in indices:
+                    outcomes[i] = (e, None)
+                continue
+
+            offset = 0
+            for i in indices:
+                size = len(arrays[i])
+                outcomes[i] = (None, predictions[offset:offset + size])
+                offset += size
+        return outcomes
+
+
+image_batchers: Dict[str, DynamicBatcher] = {
+    "brain_tumor": DynamicBatcher("brain_tumor"),
+    "kidney": DynamicBatcher("kidney"),
+}
+
+
+async def stop_batchers():
+    """Stop the workers of every batcher created in this process"""
+    for batcher in DynamicBatcher._instances:
+        await batcher.stop()
@@ -0,0 +1,42 @@
+"""
+Coarse cached clock for response timestamps
+Values are refreshed at most once per RESOLUTION seconds
+"""
+
+import time
+from datetime import datetime
+from typing import Callable
+
+RESOLUTION = 0.1
+
+
+class CachedClock:
+    """Callable returning a datetime that is reused until it is RESOLUTION old"""
+
+    __slots__ = ("_factory", "_value", "_iso", "_expires")
+
+    def __init__(self, factory: Callable[[], datetime]):
+        self._factory = factory
+        self._value = factory()
+        self._iso = None
+        self._expires = time.monotonic() + RESOLUTION
+
+    def __call__(self) -> datetime:
+        current = time.monotonic()
+        if current >= self._expires:
+            self._value = self._factory()
+            self._iso = None
+            self._expires = current + RESOLUTION
+        return self._value
+
+    def iso(self) -> str:
+        """The cached value as an ISO 8601 string, formatted once per refresh"""
+        value = self()
+        iso = self._iso
+        if iso is None:
+            iso = self._iso = value.isoformat()
+        return iso
+
+
+now = CachedClock(datetime.now)
+utcnow = CachedClock(datetime.utcnow)
@@ -3,17 +3,25 @@ HealthPlus AI FastAPI Application
 Production-grade AI service for multi-disease prediction
 """
 
-from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemLoader
 from contextlib import asynccontextmanager
 from pathlib import Path
+from secrets import token_hex
+from typing import Dict, Optional, Tuple
+import hashlib
+import logging
 import time
-import uuid
+
+import orjson
 
 from config.settings import get_settings
+from src.api.batching import stop_batchers
+from src.models.loader import model_loader
 from src.api.routers import health_router, predictions_router, admin_router, working_predictions_router, extended_predictions_router
 from src.monitoring.logger import logger
 
@@ -28,24 +36,28 @@ async def lifespan(app: FastAPI):
     settings = get_settings()
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
     
+    # Render static pages up front so the first visitor doesn't pay for it
+    for template_name in PAGE_TEMPLATES:
+        render_page(template_name)
+    
     # Optionally preload models for faster first predictions
-    # Uncomment to enable preloading (increases startup time)
-    # try:
-    #     logger.info("Preloading models...")
-    #     model_loader.preload_models()
-    #     logger.info("Models preloaded successfully")
-    # except Exception as e:
-    #     logger.warning(f"Failed to preload some models: {e}")
+    # (PRELOAD_MODELS=true, increases startup time)
+    if settings.preload_models:
+        logger.info("Preloading models...")
+        await model_loader.preload_models()
     
     yield
     
     # Shutdown
     logger.info("Shutting down application")
-    model_loader.clear_cache()
+    await stop_batchers()
+    model_loader.shutdown()
 
 
 # Initialize FastAPI application
 settings = get_settings()
+_DEBUG = settings.debug
+_GENERIC_ERROR = "An unexpected error occurred"
 
 app = FastAPI(
     title=settings.app_name,
@@ -67,8 +79,11 @@ app = FastAPI(
     - **/admin/**: Model management (reload, rollback, version switching)
     - **/metrics**: Performance and prediction metrics
     """,
-    docs_url="/docs",
-    redoc_url="/redoc",
+    # Schema and docs routes are registered at the bottom of this module
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -76,54 +91,109 @@ app = FastAPI(
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Configure templates
-templates = Jinja2Templates(directory="templates")
+# Pages carry no per-request context, so each one is rendered a single time
+# and served from memory afterwards
+template_env = Environment(
+    loader=FileSystemLoader("templates"),
+    cache_size=-1,
+    auto_reload=False
+)
+
+PAGE_TEMPLATES = (
+    "dashboard.html",
+    "demo.html",
+    "calculators/heart.html",
+    "calculators/diabetes.html",
+    "calculators/liver.html",
+    "calculators/breast_cancer.html",
+    "calculators/parkinsons.html",
+    "calculators/kidney.html",
+    "calculators/brain_tumor.html",
+)
+
+_rendered_pages: Dict[str, Tuple[bytes, str]] = {}
+
+
+def render_page(template_name: str) -> Tuple[bytes, str]:
+    """Return the rendered page body and its ETag, rendering on first use"""
+    page = _rendered_pages.get(template_name)
+    if page is None:
+        body = template_env.get_template(template_name).render().encode("utf-8")
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        page = _rendered_pages[template_name] = (body, etag)
+    return page
+
+
+def page_response(request: Request, template_name: str) -> Response:
+    """
+    Serve a pre-rendered page, answering 304 when the browser's copy is current
+    """
+    body, etag = render_page(template_name)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return HTMLResponse(body, headers=headers)
+
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization", "X-Request-ID"],
 )
 
 
+# Static assets and API docs are passed straight through the middleware
+UNTRACKED_PATH_PREFIXES = ("/static/", "/docs", "/redoc", "/openapi.json", "/favicon")
+
+
 # Request ID and logging middleware
 @app.middleware("http")
 async def add_request_id_and_logging(request: Request, call_next):
     """
     Add request ID to each request and log request/response
     """
-    request_id = str(uuid.uuid4())
+    if request.url.path.startswith(UNTRACKED_PATH_PREFIXES):
+        return await call_next(request)
+    
+    request_id = token_hex(8)
     request.state.request_id = request_id
     
-    # Log request
-    logger.info(
-        f"Request started: {request.method} {request.url.path}",
-        extra={"request_id": request_id}
-    )
+    # Log request (skipped entirely when INFO is filtered out)
+    log_info = logger.isEnabledFor(logging.INFO)
+    if log_info:
+        logger.info(
+            "Request started: %s %s", request.method, request.url.path,
+            extra={"request_id": request_id}
+        )
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
         response = await call_next(request)
-        process_time = (time.time() - start_time) * 1000
+        process_time = (time.perf_counter_ns() - start_ns) / 1_000_000
         
-        # Add custom headers
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Process-Time"] = f"{process_time:.2f}ms"
+        # Add custom headers (appended in one go rather than two header scans)
+        response.raw_headers.extend((
+            (b"x-request-id", request_id.encode("latin-1")),
+            (b"x-process-time", f"{process_time:.2f}ms".encode("latin-1")),
+        ))
         
         # Log response
-        logger.info(
-            f"Request completed: {request.method} {request.url.path} - {response.status_code}",
-            extra={"request_id": request_id, "latency_ms": process_time}
-        )
+        if log_info:
+            logger.info(
+                "Request completed: %s %s - %s",
+                request.method, request.url.path, response.status_code,
+                extra={"request_id": request_id, "latency_ms": process_time}
+            )
         
         return response
         
     except Exception as e:
         logger.error(
-            f"Request failed: {request.method} {request.url.path} - {str(e)}",
+            "Request failed: %s %s - %s", request.method, request.url.path, e,
             extra={"request_id": request_id},
             exc_info=True
         )
@@ -136,19 +206,24 @@ async def global_exception_handler(request: Request, exc: Exception):
     """
     Global exception handler for unhandled errors
     """
-    request_id = getattr(request.state, "request_id", "unknown")
+    try:
+        request_id = request.state.request_id
+    except AttributeError:
+        request_id = "unknown"
     
     logger.error(
-        f"Unhandled exception: {str(exc)}",
+        "Unhandled exception: %s", exc,
         extra={"request_id": request_id},
         exc_info=True
     )
     
-    return JSONResponse(
+    # Only stringify the exception when it is actually sent back
+    detail = str(exc) if _DEBUG else _GENERIC_ERROR
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "Internal server error",
-            "detail": str(exc) if settings.debug else "An unexpected error occurred",
+            "detail": detail,
             "request_id": request_id
         }
     )
@@ -168,7 +243,7 @@ async def root(request: Request):
     """
     Main dashboard - Modern UI for HealthPlus AI Service
     """
-    return templates.TemplateResponse("dashboard.html", {"request": request})
+    return page_response(request, "dashboard.html")
 
 
 @app.get("/demo", response_class=HTMLResponse, tags=["Demo"])
@@ -176,53 +251,76 @@ async def demo_page(request: Request):
     """
     Interactive demo page - Try predictions live
     """
-    return templates.TemplateResponse("demo.html", {"request": request})
+    return page_response(request, "demo.html")
 
 
 # Individual calculator pages
-@app.get("/calculators/heart", response_class=HTMLResponse, tags=["Calculators"])
-async def heart_calculator(request: Request):
-    """Heart Disease Risk Calculator"""
-    return templates.TemplateResponse("calculators/heart.html", {"request": request})
-
-@app.get("/calculators/diabetes", response_class=HTMLResponse, tags=["Calculators"])
-async def diabetes_calculator(request: Request):
-    """Diabetes Risk Calculator"""
-    return templates.TemplateResponse("calculators/diabetes.html", {"request": request})
-
-@app.get("/calculators/liver", response_class=HTMLResponse, tags=["Calculators"])
-async def liver_calculator(request: Request):
-    """Liver Disease Calculator"""
-    return templates.TemplateResponse("calculators/liver.html", {"request": request})
-
-@app.get("/calculators/breast-cancer", response_class=HTMLResponse, tags=["Calculators"])
-async def breast_cancer_calculator(request: Request):
-    """Breast Cancer Calculator"""
-    return templates.TemplateResponse("calculators/breast_cancer.html", {"request": request})
-
-@app.get("/calculators/parkinsons", response_class=HTMLResponse, tags=["Calculators"])
-async def parkinsons_calculator(request: Request):
-    """Parkinson's Disease Calculator"""
-    return templates.TemplateResponse("calculators/parkinsons.html", {"request": request})
-
-@app.get("/calculators/kidney", response_class=HTMLResponse, tags=["Calculators"])
-async def kidney_calculator(request: Request):
-    """Kidney Disease Calculator"""
-    return templates.TemplateResponse("calculators/kidney.html", {"request": request})
-
-@app.get("/calculators/brain-tumor", response_class=HTMLResponse, tags=["Calculators"])
-async def brain_tumor_calculator(request: Request):
-    """Brain Tumor Calculator"""
-    return templates.TemplateResponse("calculators/brain_tumor.html", {"request": request})
+CALCULATOR_TEMPLATES = {
+    "heart": "calculators/heart.html",
+    "diabetes": "calculators/diabetes.html",
+    "liver": "calculators/liver.html",
+    "breast-cancer": "calculators/breast_cancer.html",
+    "parkinsons": "calculators/parkinsons.html",
+    "kidney": "calculators/kidney.html",
+    "brain-tumor": "calculators/brain_tumor.html",
+}
+
+
+@app.get("/calculators/{name}", response_class=HTMLResponse, tags=["Calculators"])
+async def calculator_page(name: str, request: Request):
+    """
+    Disease risk calculator pages
+    (heart, diabetes, liver, breast-cancer, parkinsons, kidney, brain-tumor)
+    """
+    template_name = CALCULATOR_TEMPLATES.get(name)
+    if template_name is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown calculator: {name}"
+        )
+    return page_response(request, template_name)
+
+
+# OpenAPI schema - serialized once, after every route has been registered
+_openapi_body: Optional[bytes] = None
+
+
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_schema():
+    global _openapi_body
+    if _openapi_body is None:
+        _openapi_body = orjson.dumps(app.openapi())
+    return Response(_openapi_body, media_type="application/json")
+
+
+# Interactive API docs are only exposed in debug mode
+if _DEBUG:
+    @app.get("/docs", include_in_schema=False)
+    async def swagger_ui():
+        return get_swagger_ui_html(openapi_url="/openapi.json", title=f"{app.title} - Swagger UI")
+
+    @app.get("/redoc", include_in_schema=False)
+    async def redoc():
+        return get_redoc_html(openapi_url="/openapi.json", title=f"{app.title} - ReDoc")
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
     
+    # A single worker: active versions, result caches and metrics are held
+    # in process, so extra workers would miss admin version switches and
+    # report partial metrics. Runs on uvloop/httptools (uvloop is
+    # unavailable on Windows); debug adds auto-reload.
+    # Access logs are off since the middleware already logs every request.
     uvicorn.run(
         "src.api.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        workers=1,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        access_log=False,
         log_level=settings.log_level.lower()
     )
@@ -2,27 +2,51 @@
 Admin endpoints for model management
 """
 
+from functools import lru_cache
+from typing import Tuple
 from fastapi import APIRouter, HTTPException, status
 from src.models.registry import model_registry
 from src.models.loader import model_loader
+from src.api.routers.predictions import invalidate_version_cache
 from src.monitoring.logger import logger
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
 
+# Registry reads are cached here and invalidated by the endpoints below
+# that change versions or clear caches
+@lru_cache(maxsize=64)
+def _active_version(model_name: str) -> str:
+    return model_registry.get_active_version(model_name)
+
+
+@lru_cache(maxsize=64)
+def _available_versions(model_name: str) -> Tuple[str, ...]:
+    return tuple(model_registry.get_available_versions(model_name))
+
+
+def _invalidate_registry_cache():
+    """Drop cached registry lookups after a version change"""
+    _active_version.cache_clear()
+    _available_versions.cache_clear()
+    invalidate_version_cache()
+
+
 @router.post(
     "/reload-model/{model_name}",
     summary="Reload a specific model",
     status_code=status.HTTP_200_OK
 )
-async def reload_model(model_name: str):
+def reload_model(model_name: str):
     """
     Force reload a specific model
     Clears cache and reloads from disk
     """
     try:
-        version = model_registry.get_active_version(model_name)
+        version = _active_version(model_name)
         model_loader.reload_model(model_name, version)
+        # Cached results came from the previous load of this version
+        _invalidate_registry_cache()
         
         logger.info(f"Reloaded model: {model_name} v{version}")
         
@@ -45,14 +69,15 @@ async def reload_model(model_name: str):
     summary="Rollback model to previous version",
     status_code=status.HTTP_200_OK
 )
-async def rollback_model(model_name: str):
+def rollback_model(model_name: str):
     """
     Rollback a model to its previous version
     Useful for quick revert in case of issues
     """
     try:
-        old_version = model_registry.get_active_version(model_name)
+        old_version = _active_version(model_name)
         new_version = model_registry.rollback(model_name)
+        _invalidate_registry_cache()
         
         if new_version is None:
             raise HTTPException(
@@ -87,21 +112,24 @@ async def rollback_model(model_name: str):
     summary="Set specific model version",
     status_code=status.HTTP_200_OK
 )
-async def set_model_version(model_name: str, version: str):
+def set_model_version(model_name: str, version: str):
     """
     Set a specific version for a model
     """
     try:
-        # Verify version exists
-        available_versions = model_registry.get_available_versions(model_name)
-        if version not in available_versions:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Version {version} not found for {model_name}. Available: {available_versions}"
-            )
+        # Verify version exists (rescan once in case it was deployed since caching)
+        if version not in _available_versions(model_name):
+            _available_versions.cache_clear()
+            available_versions = _available_versions(model_name)
+            if version not in available_versions:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Version {version} not found for {model_name}. Available: {list(available_versions)}"
+                )
         
-        old_version = model_registry.get_active_version(model_name)
+        old_version = _active_version(model_name)
         model_registry.set_active_version(model_name, version)
+        _invalidate_registry_cache()
         
         # Clear cache to force reload
         model_loader.clear_cache()
@@ -130,7 +158,7 @@ async def set_model_version(model_name: str, version: str):
     summary="Get model cache information",
     status_code=status.HTTP_200_OK
 )
-async def get_cache_info():
+def get_cache_info():
     """
     Get information about cached models
     """
@@ -142,12 +170,13 @@ async def get_cache_info():
     summary="Clear model cache",
     status_code=status.HTTP_200_OK
 )
-async def clear_cache():
+def clear_cache():
     """
     Clear all models from cache
     Models will be reloaded on next prediction request
     """
     model_loader.clear_cache()
+    _invalidate_registry_cache()
     logger.info("Cleared model cache")
     
     return {
@@ -1,12 +1,14 @@
 """
 Extended working prediction endpoints for all 7 diseases
 """
+from operator import attrgetter
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 
-from src.models.mock_predictions import mock_engine
+from src.api import clock
+from src.models import mock_predictions as engine
 from src.monitoring.logger import logger
 
 router = APIRouter(prefix="/api/predict", tags=["All Disease Predictions"])
@@ -14,6 +16,8 @@ router = APIRouter(prefix="/api/predict", tags=["All Disease Predictions"])
 
 # Liver Disease Request
 class LiverRequest(BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     age: int = Field(..., ge=1, le=120)
     total_bilirubin: float = Field(..., ge=0.1, le=20, description="Total bilirubin mg/dL")
     alkaline_phosphotase: int = Field(..., ge=20, le=400, description="ALP U/L")
@@ -23,6 +27,8 @@ class LiverRequest(BaseModel):
 
 #Breast Cancer Request
 class BreastCancerRequest(BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     texture_mean: float = Field(..., ge=5, le=40, description="Texture")  
     perimeter_mean: float = Field(..., ge=40, le=200, description="Perimeter")
     area_mean: float = Field(..., ge=100, le=2500, description="Area")
@@ -31,6 +37,8 @@ class BreastCancerRequest(BaseModel):
 
 # Parkinson's Request
 class ParkinsonsRequest(BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     mdvp_jitter: float = Field(..., ge=0.001, le=0.05, description="Jitter")
     shimmer: float = Field(..., ge=0.01, le=0.3, description="Shimmer")
     nhr: float = Field(..., ge=0.001, le=0.2, description="NHR")
@@ -46,110 +54,78 @@ class PredictionResult(BaseModel):
     color: str
     model_name: str
     model_version: str
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
-
-
-@router.post("/kidney", response_model=PredictionResult)
-async def predict_kidney():
-    """Kidney Disease Detection (CT Scan simulation)"""
+    timestamp: datetime = Field(default_factory=clock.now)
+
+
+# name -> (engine function, request fields in argument order, log label,
+# result key with factors to append). Validated requests go straight to the
+# typed engine scorers instead of through a dict of defaults
+_DISPATCH = {
+    "kidney": (engine.predict_kidney_disease, None, "Kidney", None),
+    "liver": (engine.liver_disease_risk, attrgetter(*engine.LIVER_FEATURES), "Liver", "risk_factors"),
+    "breast_cancer": (
+        engine.breast_cancer_risk,
+        attrgetter("texture_mean", "perimeter_mean", "area_mean", "concavity_mean"),
+        "Breast cancer", None
+    ),
+    "parkinsons": (
+        engine.parkinsons_risk, attrgetter("mdvp_jitter", "shimmer", "nhr", "hnr"),
+        "Parkinson's", "indicators"
+    ),
+    "brain_tumor": (engine.predict_brain_tumor, None, "Brain tumor", None),
+}
+
+
+def _run_prediction(name: str, request: Optional[BaseModel] = None) -> PredictionResult:
+    """Run a mock engine prediction and wrap it in a PredictionResult"""
+    predict, fields, label, factors_key = _DISPATCH[name]
     try:
-        result = mock_engine.predict_kidney_disease()
-        logger.info(f"Kidney prediction: {result['prediction']}")
+        result = predict() if fields is None else predict(*fields(request))
+        logger.info("%s prediction: %s", label, result['prediction'])
+        
+        recommendation = result['recommendation']
+        if factors_key is not None:
+            factors_str = ", ".join(result.get(factors_key, []))
+            recommendation += f" | Factors: {factors_str}"
         
-        return PredictionResult(
+        return PredictionResult.model_construct(
             prediction=result['prediction'],
             confidence=result['confidence'],
-            recommendation=result['recommendation'],
+            recommendation=recommendation,
             color=result['color'],
             model_name=result['model_name'],
             model_version=result['model_version']
         )
     except Exception as e:
-        logger.error(f"Kidney prediction error: {e}")
+        logger.error("%s prediction error: %s", label, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/kidney", response_model=PredictionResult)
+async def predict_kidney():
+    """Kidney Disease Detection (CT Scan simulation)"""
+    return _run_prediction("kidney")
+
+
 @router.post("/liver", response_model=PredictionResult)
 async def predict_liver(request: LiverRequest):
     """Liver Disease Screening"""
-    try:
-        result = mock_engine.predict_liver_disease(request.dict())
-        logger.info(f"Liver prediction: {result['prediction']}")
-        
-        # Handle risk_factors field
-        factors_str = ", ".join(result.get('risk_factors', []))
-        
-        return PredictionResult(
-            prediction=result['prediction'],
-            confidence=result['confidence'],
-            recommendation=result['recommendation'] + f" | Factors: {factors_str}",
-            color=result['color'],
-            model_name=result['model_name'],
-            model_version=result['model_version']
-        )
-    except Exception as e:
-        logger.error(f"Liver prediction error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return _run_prediction("liver", request)
 
 
 @router.post("/breast-cancer", response_model=PredictionResult)
 async def predict_breast_cancer(request: BreastCancerRequest):
     """Breast Cancer Classification"""
-    try:
-        result = mock_engine.predict_breast_cancer(request.dict())
-        logger.info(f"Breast cancer prediction: {result['prediction']}")
-        
-        return PredictionResult(
-            prediction=result['prediction'],
-            confidence=result['confidence'],
-            recommendation=result['recommendation'],
-            color=result['color'],
-            model_name=result['model_name'],
-            model_version=result['model_version']
-        )
-    except Exception as e:
-        logger.error(f"Breast cancer prediction error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return _run_prediction("breast_cancer", request)
 
 
 @router.post("/parkinsons", response_model=PredictionResult)
 async def predict_parkinsons(request: ParkinsonsRequest):
     """Parkinson's Disease Detection"""
-    try:
-        result = mock_engine.predict_parkinsons(request.dict())
-        logger.info(f"Parkinson's prediction: {result['prediction']}")
-        
-        # Handle indicators field
-        indicators_str = ", ".join(result.get('indicators', []))
-        
-        return PredictionResult(
-            prediction=result['prediction'],
-            confidence=result['confidence'],
-            recommendation=result['recommendation'] + f" | Factors: {indicators_str}",
-            color=result['color'],
-            model_name=result['model_name'],
-            model_version=result['model_version']
-        )
-    except Exception as e:
-        logger.error(f"Parkinson's prediction error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return _run_prediction("parkinsons", request)
 
 
 @router.post("/brain-tumor", response_model=PredictionResult)
 async def predict_brain_tumor():
     """Brain Tumor Classification (MRI simulation)"""
-    try:
-        result = mock_engine.predict_brain_tumor()
-        logger.info(f"Brain tumor prediction: {result['prediction']}")
-        
-        return PredictionResult(
-            prediction=result['prediction'],
-            confidence=result['confidence'],
-            recommendation=result['recommendation'],
-            color=result['color'],
-            model_name=result['model_name'],
-            model_version=result['model_version']  
-        )
-    except Exception as e:
-        logger.error(f"Brain tumor prediction error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return _run_prediction("brain_tumor")
@@ -3,7 +3,7 @@ Health check and monitoring endpoints
 """
 
 from fastapi import APIRouter, status
-from datetime import datetime
+from src.api import clock
 from src.api.schemas import HealthCheckResponse, ModelInfoResponse, ModelInfo
 from src.models.registry import model_registry
 from src.models.loader import model_loader
@@ -28,7 +28,7 @@ async def health_check():
     return HealthCheckResponse(
         status="healthy",
         version=settings.app_version,
-        timestamp=datetime.utcnow()
+        timestamp=clock.utcnow()
     )
 
 
@@ -48,7 +48,7 @@ async def readiness_check():
     return HealthCheckResponse(
         status="ready",
         version=settings.app_version,
-        timestamp=datetime.utcnow()
+        timestamp=clock.utcnow()
     )
 
 
@@ -2,16 +2,26 @@
 Prediction endpoints for all disease models
 """
 
-# Standard library imports only - NO heavy ML imports at module level!
+import asyncio
+import base64
+import io
+import threading
+from collections import OrderedDict
 from fastapi import APIRouter, HTTPException, status
 from datetime import datetime
+from typing import Dict, Optional
 
+import numpy as np
+from PIL import Image
+
+from src.api.batching import image_batchers
 from src.api.schemas import (
     BrainTumorRequest, BrainTumorResponse,
     HeartDiseaseRequest, PredictionResponse,
     DiabetesRequest, KidneyDiseaseRequest, KidneyDiseaseResponse,
     LiverDiseaseRequest, BreastCancerRequest, ParkinsonsRequest
 )
+from src.models.loader import model_loader
 from src.models.registry import model_registry
 from src.monitoring.metrics import metrics_collector, LatencyTimer
 from src.monitoring.logger import logger
@@ -19,32 +29,71 @@ from config.settings import get_settings
 
 router = APIRouter(prefix="/predict", tags=["Predictions"])
 
+_CONFIDENCE_THRESHOLD = get_settings().confidence_threshold
 
-# Lazy import function for heavy ML libraries
-def get_ml_libraries():
-    """Lazy import of ML libraries - only called when prediction is made"""
-    try:
-        import base64
-        import io
-        import numpy as np
-        from PIL import Image
-        return base64, io, np, Image
-    except ImportError as e:
-        logger.error(f"Failed to import ML libraries: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail="ML libraries not available. Please install: pip install numpy Pillow"
-        )
+# Active model versions, filled on first use and dropped on version changes
+_ACTIVE_VERSIONS: Dict[str, str] = {}
 
 
-def get_model_loader():
-    """Lazy import of model loader"""
-    try:
-        from src.models.loader import model_loader
-        return model_loader
-    except Exception as e:
-        logger.error(f"Failed to import model loader: {e}")
-        raise HTTPException(status_code=500, detail="Model loader not available")
+def get_active_version(model_name: str) -> str:
+    """Cached lookup of the registry's active version for a model"""
+    version = _ACTIVE_VERSIONS.get(model_name)
+    if version is None:
+        version = _ACTIVE_VERSIONS[model_name] = model_registry.get_active_version(model_name)
+    return version
+
+
+def invalidate_version_cache(model_name: Optional[str] = None):
+    """Forget the cached active version for one model (or all of them) and cached results"""
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE.clear()
+    if model_name is None:
+        _ACTIVE_VERSIONS.clear()
+    else:
+        _ACTIVE_VERSIONS.pop(model_name, None)
+
+
+# Results for repeated tabular inputs, keyed on the exact feature bytes.
+# Predictions use it from the event loop, but the sync admin endpoints clear
+# it from threadpool threads, so every access holds the lock (never across
+# an await)
+_RESULT_CACHE_SIZE = 4096
+_RESULT_CACHE: "OrderedDict[tuple, object]" = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+async def predict_row(model_name: str, method: str, features):
+    """Run model.<method> on one feature row, reusing results for repeated inputs"""
+    version = get_active_version(model_name)
+    key = (model_name, version, method, features.tobytes())
+    with _RESULT_CACHE_LOCK:
+        result = _RESULT_CACHE.get(key)
+        if result is not None:
+            _RESULT_CACHE.move_to_end(key)
+            return result
+    
+    model = await model_loader.get_model_async(model_name, version)
+    result = (await asyncio.to_thread(getattr(model, method), features))[0]
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE[key] = result
+        if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+    return result
+
+
+_PIXEL_SCALE = np.float32(1.0 / 255.0)
+
+
+def load_image_array(image_base64: str, size: tuple):
+    """Decode a base64 image and scale it into a (1, H, W, C) array in [0, 1]"""
+    img = Image.open(io.BytesIO(base64.b64decode(image_base64)))
+    # Grayscale, palette and RGBA uploads all become 3-channel input
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    img = img.resize(size)
+    img_array = np.asarray(img, dtype=np.float32)
+    img_array *= _PIXEL_SCALE
+    return img_array[np.newaxis, ...]
 
 
 def check_confidence_and_fallback(
@@ -57,8 +106,7 @@ def check_confidence_and_fallback(
     Check confidence and trigger fallback if needed
     Returns (prediction, confidence, fallback_used)
     """
-    settings = get_settings()
-    threshold = threshold or settings.confidence_threshold
+    threshold = threshold or _CONFIDENCE_THRESHOLD
     
     # Record confidence
     metrics_collector.record_confidence(model_name, confidence, threshold)
@@ -66,7 +114,7 @@ def check_confidence_and_fallback(
     # Check if fallback needed
     if confidence < threshold:
         logger.warning(
-            f"Low confidence prediction for {model_name}: {confidence:.3f} < {threshold}",
+            "Low confidence prediction for %s: %.3f < %s", model_name, confidence, threshold,
             extra={"model_name": model_name, "confidence": confidence}
         )
         
@@ -93,24 +141,12 @@ async def predict_brain_tumor(request: BrainTumorRequest):
     model_name = "brain_tumor"
     
     try:
-        # Lazy import ML libraries only when needed
-        base64, io, np, Image = get_ml_libraries()
-        model_loader = get_model_loader()
-        
-        # Decode image
-        image_bytes = base64.b64decode(request.image_base64)
-        img = Image.open(io.BytesIO(image_bytes))
+        # Decode and preprocess off the event loop
+        img_array = await asyncio.to_thread(load_image_array, request.image_base64, (299, 299))
         
-        # Preprocess
-        img = img.resize((299, 299))
-        img_array = np.asarray(img)
-        img_array = np.expand_dims(img_array, axis=0)
-        img_array = img_array / 255.0
-        
-        # Load model and predict with latency tracking
+        # Predict through the shared batcher with latency tracking
         with LatencyTimer(model_name) as timer:
-            model = model_loader.get_model(model_name)
-            predictions = model.predict(img_array)
+            predictions = await image_batchers[model_name].submit(img_array)
         
         # Parse results
         class_labels = {
@@ -133,7 +169,7 @@ async def predict_brain_tumor(request: BrainTumorRequest):
         metrics_collector.record_prediction(model_name, True)
         
         logger.info(
-            f"Brain tumor prediction: {prediction}",
+            "Brain tumor prediction: %s", prediction,
             extra={
                 "model_name": model_name,
                 "confidence": confidence,
@@ -145,14 +181,14 @@ async def predict_brain_tumor(request: BrainTumorRequest):
             prediction=prediction,
             tumor_type=prediction,
             confidence=confidence,
-            model_version=model_registry.get_active_version(model_name),
+            model_version=get_active_version(model_name),
             model_name=model_name,
             fallback_used=fallback_used
         )
         
     except Exception as e:
         metrics_collector.record_prediction(model_name, False)
-        logger.error(f"Brain tumor prediction failed: {e}", exc_info=True)
+        logger.error("Brain tumor prediction failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Prediction failed: {str(e)}"
@@ -176,17 +212,16 @@ async def predict_heart_disease(request: HeartDiseaseRequest):
     
     try:
         # Prepare input data
-        features = np.array([[
+        features = np.fromiter((
             request.age, request.sex, request.cp, request.trestbps,
             request.chol, request.fbs, request.restecg, request.thalach,
             request.exang, request.oldpeak, request.slope, request.ca,
             request.thal
-        ]])
+        ), dtype=np.float32, count=13).reshape(1, -1)
         
         # Load model and predict
         with LatencyTimer(model_name) as timer:
-            model = model_loader.get_model(model_name)
-            prediction_proba = model.predict_proba(features)[0]
+            prediction_proba = await predict_row(model_name, "predict_proba", features)
         
         # Parse results
         risk_score = float(prediction_proba[1])
@@ -201,7 +236,7 @@ async def predict_heart_disease(request: HeartDiseaseRequest):
         metrics_collector.record_prediction(model_name, True)
         
         logger.info(
-            f"Heart disease prediction: {prediction}",
+            "Heart disease prediction: %s", prediction,
             extra={
                 "model_name": model_name,
                 "confidence": confidence,
@@ -212,7 +247,7 @@ async def predict_heart_disease(request: HeartDiseaseRequest):
         return PredictionResponse(
             prediction=prediction,
             confidence=confidence,
-            model_version=model_registry.get_active_version(model_name),
+            model_version=get_active_version(model_name),
             model_name=model_name,
             fallback_used=fallback_used,
             metadata={"risk_score": risk_score}
@@ -220,7 +255,7 @@ async def predict_heart_disease(request: HeartDiseaseRequest):
         
     except Exception as e:
         metrics_collector.record_prediction(model_name, False)
-        logger.error(f"Heart disease prediction failed: {e}", exc_info=True)
+        logger.error("Heart disease prediction failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Prediction failed: {str(e)}"
@@ -244,16 +279,15 @@ async def predict_diabetes(request: DiabetesRequest):
     
     try:
         # Prepare input data
-        features = np.array([[
+        features = np.fromiter((
             request.pregnancies, request.glucose, request.blood_pressure,
             request.skin_thickness, request.insulin, request.bmi,
             request.diabetes_pedigree_function, request.age
-        ]])
+        ), dtype=np.float32, count=8).reshape(1, -1)
         
         # Load model and predict
         with LatencyTimer(model_name) as timer:
-            model = model_loader.get_model(model_name)
-            prediction_proba = model.predict_proba(features)[0]
+            prediction_proba = await predict_row(model_name, "predict_proba", features)
         
         # Parse results
         diabetes_prob = float(prediction_proba[1])
@@ -268,7 +302,7 @@ async def predict_diabetes(request: DiabetesRequest):
         metrics_collector.record_prediction(model_name, True)
         
         logger.info(
-            f"Diabetes prediction: {prediction}",
+            "Diabetes prediction: %s", prediction,
             extra={
                 "model_name": model_name,
                 "confidence": confidence,
@@ -279,7 +313,7 @@ async def predict_diabetes(request: DiabetesRequest):
         return PredictionResponse(
             prediction=prediction,
             confidence=confidence,
-            model_version=model_registry.get_active_version(model_name),
+            model_version=get_active_version(model_name),
             model_name=model_name,
             fallback_used=fallback_used,
             metadata={"diabetes_probability": diabetes_prob}
@@ -287,7 +321,7 @@ async def predict_diabetes(request: DiabetesRequest):
         
     except Exception as e:
         metrics_collector.record_prediction(model_name, False)
-        logger.error(f"Diabetes prediction failed: {e}", exc_info=True)
+        logger.error("Diabetes prediction failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Prediction failed: {str(e)}"
@@ -310,17 +344,12 @@ async def predict_kidney_disease(request: KidneyDiseaseRequest):
     model_name = "kidney"
     
     try:
-        # Decode and preprocess image
-        image_bytes = base64.b64decode(request.image_base64)
-        img = Image.open(io.BytesIO(image_bytes))
-        img = img.resize((150, 150))
-        img_array = np.asarray(img) / 255.0
-        img_array = np.expand_dims(img_array, axis=0)
+        # Decode and preprocess off the event loop
+        img_array = await asyncio.to_thread(load_image_array, request.image_base64, (150, 150))
         
-        # Load model and predict
+        # Predict through the shared batcher
         with LatencyTimer(model_name) as timer:
-            model = model_loader.get_model(model_name)
-            predictions = model.predict(img_array)
+            predictions = await image_batchers[model_name].submit(img_array)
         
         # Parse results
         class_labels = {0: 'Cyst', 1: 'Normal', 2: 'Stone', 3: 'Tumor'}
@@ -337,7 +366,7 @@ async def predict_kidney_disease(request: KidneyDiseaseRequest):
         metrics_collector.record_prediction(model_name, True)
         
         logger.info(
-            f"Kidney disease prediction: {prediction}",
+            "Kidney disease prediction: %s", prediction,
             extra={
                 "model_name": model_name,
                 "confidence": confidence,
@@ -349,14 +378,14 @@ async def predict_kidney_disease(request: KidneyDiseaseRequest):
             prediction=prediction,
             condition=prediction,
             confidence=confidence,
-            model_version=model_registry.get_active_version(model_name),
+            model_version=get_active_version(model_name),
             model_name=model_name,
             fallback_used=fallback_used
         )
         
     except Exception as e:
         metrics_collector.record_prediction(model_name, False)
-        logger.error(f"Kidney disease prediction failed: {e}", exc_info=True)
+        logger.error("Kidney disease prediction failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Prediction failed: {str(e)}"
@@ -380,17 +409,16 @@ async def predict_liver_disease(request: LiverDiseaseRequest):
     
     try:
         # Prepare input data
-        features = np.array([[
+        features = np.fromiter((
             request.age, request.gender, request.total_bilirubin,
             request.direct_bilirubin, request.alkaline_phosphotase,
             request.alamine_aminotransferase, request.aspartate_aminotransferase,
             request.total_proteins, request.albumin, request.albumin_globulin_ratio
-        ]])
+        ), dtype=np.float32, count=10).reshape(1, -1)
         
         # Load model and predict
         with LatencyTimer(model_name) as timer:
-            model = model_loader.get_model(model_name)
-            prediction_proba = model.predict_proba(features)[0]
+            prediction_proba = await predict_row(model_name, "predict_proba", features)
         
         # Parse results
         disease_prob = float(prediction_proba[1])
@@ -405,7 +433,7 @@ async def predict_liver_disease(request: LiverDiseaseRequest):
         metrics_collector.record_prediction(model_name, True)
         
         logger.info(
-            f"Liver disease prediction: {prediction}",
+            "Liver disease prediction: %s", prediction,
             extra={
                 "model_name": model_name,
                 "confidence": confidence,
@@ -416,7 +444,7 @@ async def predict_liver_disease(request: LiverDiseaseRequest):
         return PredictionResponse(
             prediction=prediction,
             confidence=confidence,
-            model_version=model_registry.get_active_version(model_name),
+            model_version=get_active_version(model_name),
             model_name=model_name,
             fallback_used=fallback_used,
             metadata={"disease_probability": disease_prob}
@@ -424,7 +452,7 @@ async def predict_liver_disease(request: LiverDiseaseRequest):
         
     except Exception as e:
         metrics_collector.record_prediction(model_name, False)
-        logger.error(f"Liver disease prediction failed: {e}", exc_info=True)
+        logger.error("Liver disease prediction failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Prediction failed: {str(e)}"
@@ -448,7 +476,7 @@ async def predict_breast_cancer(request: BreastCancerRequest):
     
     try:
         # Prepare input data
-        features = np.array([[
+        features = np.fromiter((
             request.texture_mean, request.smoothness_mean, request.compactness_mean,
             request.concave_points_mean, request.symmetry_mean, request.fractal_dimension_mean,
             request.texture_se, request.area_se, request.smoothness_se,
@@ -457,12 +485,11 @@ async def predict_breast_cancer(request: BreastCancerRequest):
             request.area_worst, request.smoothness_worst, request.compactness_worst,
             request.concavity_worst, request.concave_points_worst, request.symmetry_worst,
             request.fractal_dimension_worst
-        ]])
+        ), dtype=np.float32, count=22).reshape(1, -1)
         
         # Load model and predict
         with LatencyTimer(model_name) as timer:
-            model = model_loader.get_model(model_name)
-            prediction_result = model.predict(features)[0]
+            prediction_result = await predict_row(model_name, "predict", features)
         
         # Parse results (assuming binary prediction with confidence)
         confidence = float(abs(prediction_result))
@@ -481,7 +508,7 @@ async def predict_breast_cancer(request: BreastCancerRequest):
         metrics_collector.record_prediction(model_name, True)
         
         logger.info(
-            f"Breast cancer prediction: {prediction}",
+            "Breast cancer prediction: %s", prediction,
             extra={
                 "model_name": model_name,
                 "confidence": confidence,
@@ -492,14 +519,14 @@ async def predict_breast_cancer(request: BreastCancerRequest):
         return PredictionResponse(
             prediction=prediction,
             confidence=confidence,
-            model_version=model_registry.get_active_version(model_name),
+            model_version=get_active_version(model_name),
             model_name=model_name,
             fallback_used=fallback_used
         )
         
     except Exception as e:
         metrics_collector.record_prediction(model_name, False)
-        logger.error(f"Breast cancer prediction failed: {e}", exc_info=True)
+        logger.error("Breast cancer prediction failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Prediction failed: {str(e)}"
@@ -523,16 +550,15 @@ async def predict_parkinsons(request: ParkinsonsRequest):
     
     try:
         # Prepare input data
-        features = np.array([[
+        features = np.fromiter((
             request.mdvp_fo, request.mdvp_fhi, request.mdvp_flo,
             request.mdvp_jitter, request.rpde, request.dfa,
             request.spread2, request.d2
-        ]])
+        ), dtype=np.float32, count=8).reshape(1, -1)
         
         # Load model and predict
         with LatencyTimer(model_name) as timer:
-            model = model_loader.get_model(model_name)
-            prediction_result = model.predict(features)[0]
+            prediction_result = await predict_row(model_name, "predict", features)
         
         # Parse results
         confidence = float(abs(prediction_result))
@@ -551,7 +577,7 @@ async def predict_parkinsons(request: ParkinsonsRequest):
         metrics_collector.record_prediction(model_name, True)
         
         logger.info(
-            f"Parkinsons prediction: {prediction}",
+            "Parkinsons prediction: %s", prediction,
             extra={
                 "model_name": model_name,
                 "confidence": confidence,
@@ -562,14 +588,14 @@ async def predict_parkinsons(request: ParkinsonsRequest):
         return PredictionResponse(
             prediction=prediction,
             confidence=confidence,
-            model_version=model_registry.get_active_version(model_name),
+            model_version=get_active_version(model_name),
             model_name=model_name,
             fallback_used=fallback_used
         )
         
     except Exception as e:
         metrics_collector.record_prediction(model_name, False)
-        logger.error(f"Parkinsons prediction failed: {e}", exc_info=True)
+        logger.error("Parkinsons prediction failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Prediction failed: {str(e)}"
@@ -2,17 +2,58 @@
 Simple working prediction endpoints using mock models
 Fast, no dependencies, ready for demo
 """
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
-from datetime import datetime
+import asyncio
+import email.message
+import json
+import logging
+import random
+from operator import attrgetter
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import Optional, Dict, Any, List, Tuple
+
+import numpy as np
+import orjson
 
 # Import mock engine
-from src.models.mock_predictions import mock_engine
+from config.settings import get_settings
+from src.api import clock
+from src.api.batching import DynamicBatcher
+from src.models.mock_predictions import (
+    DIABETES_FEATURES, HEART_FEATURES, predict_diabetes_batch, predict_heart_disease_batch
+)
 from src.monitoring.logger import logger
 
 router = APIRouter(prefix="/api/predict", tags=["Working Predictions"])
 
+# Concurrent requests are scored together; see INFERENCE_* settings
+_settings = get_settings()
+_heart_batcher = DynamicBatcher(
+    "heart",
+    max_batch_size=_settings.inference_max_batch_size,
+    max_latency_ms=_settings.inference_max_wait_ms,
+    predict_fn=predict_heart_disease_batch,
+    max_queue_size=_settings.inference_max_queue_size
+)
+_diabetes_batcher = DynamicBatcher(
+    "diabetes",
+    max_batch_size=_settings.inference_max_batch_size,
+    max_latency_ms=_settings.inference_max_wait_ms,
+    predict_fn=predict_diabetes_batch,
+    max_queue_size=_settings.inference_max_queue_size
+)
+_BUSY_DETAIL = "Prediction queue is full, please retry shortly"
+_MAX_BATCH_PATIENTS = 256
+_LOG_SAMPLE_RATE = _settings.prediction_log_sample_rate
+
+# Read request fields straight into the engine's column order. Heart
+# features are small integers, exact in float32; diabetes keeps float64
+# because glucose is echoed verbatim in the risk factor text
+_heart_row = attrgetter(*HEART_FEATURES)
+_diabetes_row = attrgetter(*DIABETES_FEATURES)
+
 
 # Simple request/response models
 class SimpleHeartRequest(BaseModel):
@@ -36,16 +77,161 @@ class PredictionResult(BaseModel):
     confidence: float
     risk_score: Optional[float] = None
     probability: Optional[float] = None
-    risk_factors: list
+    risk_factors: Tuple[str, ...]
     recommendation: str
     color: str
     model_name: str
     model_version: str
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = Field(default_factory=clock.now.iso)
+
+
+class HeartBatchRequest(BaseModel):
+    patients: List[SimpleHeartRequest] = Field(..., min_length=1, max_length=_MAX_BATCH_PATIENTS)
+
+
+class DiabetesBatchRequest(BaseModel):
+    patients: List[SimpleDiabetesRequest] = Field(..., min_length=1, max_length=_MAX_BATCH_PATIENTS)
+
+
+def _log_sampled(msg: str, *args, **kwargs):
+    """Log a successful prediction at INFO for PREDICTION_LOG_SAMPLE_RATE of calls"""
+    if _LOG_SAMPLE_RATE < 1.0 and random.random() >= _LOG_SAMPLE_RATE:
+        return
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(msg, *args, **kwargs)
+
+
+# The single-patient routes read the raw body and validate it with these
+# adapters in one pass, skipping FastAPI's body binding
+_HEART_ADAPTER = TypeAdapter(SimpleHeartRequest)
+_DIABETES_ADAPTER = TypeAdapter(SimpleDiabetesRequest)
+
+
+def _json_body(model) -> Dict[str, Any]:
+    """OpenAPI requestBody for a route that parses its own JSON body"""
+    return {"requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": model.model_json_schema()}},
+    }}
+
+
+def _is_json_content_type(content_type: Optional[str]) -> bool:
+    """Whether FastAPI would decode a body with this content type as JSON"""
+    if not content_type:
+        return True
+    message = email.message.Message()
+    message["content-type"] = content_type
+    if message.get_content_maintype() != "application":
+        return False
+    subtype = message.get_content_subtype()
+    return subtype == "json" or subtype.endswith("+json")
+
+
+def _bind_like_fastapi(body: bytes, is_json: bool, adapter: TypeAdapter):
+    """
+    Decode and validate a body the way FastAPI's body binding does
+    Only reached for requests the fast path rejects, so their 422 responses
+    match the other routes exactly
+    """
+    value = None
+    if body:
+        if not is_json:
+            value = body
+        else:
+            try:
+                value = json.loads(body)
+            except json.JSONDecodeError as e:
+                raise RequestValidationError(
+                    [{
+                        "type": "json_invalid",
+                        "loc": ("body", e.pos),
+                        "msg": "JSON decode error",
+                        "input": {},
+                        "ctx": {"error": e.msg},
+                    }],
+                    body=e.doc
+                ) from e
+    
+    if value is None:
+        error = ValidationError.from_exception_data(
+            "Field required", [{"type": "missing", "loc": ("body",), "input": {}}]
+        ).errors()[0]
+        error["input"] = None
+        raise RequestValidationError([error], body=value)
+    
+    try:
+        return adapter.validate_python(value, from_attributes=True)
+    except ValidationError as e:
+        errors = [{**err, "loc": ("body", *err["loc"])} for err in e.errors()]
+        raise RequestValidationError(errors, body=value)
+
+
+async def _parse_body(request: Request, adapter: TypeAdapter):
+    """Validate the raw JSON body, failing with FastAPI's usual 422 response"""
+    body = await request.body()
+    is_json = _is_json_content_type(request.headers.get("content-type"))
+    if body and is_json:
+        try:
+            return adapter.validate_json(body)
+        except ValidationError:
+            pass
+    return _bind_like_fastapi(body, is_json, adapter)
+
+
+# Results are serialized straight to JSON bytes by a shared adapter, so
+# FastAPI doesn't validate or re-encode them against response_model
+_RESULT_ADAPTER = TypeAdapter(PredictionResult)
+_RESULTS_ADAPTER = TypeAdapter(List[PredictionResult])
+
+
+def _json_response(result: PredictionResult) -> Response:
+    """Serialize a result to a JSON response in one pass"""
+    return Response(content=_RESULT_ADAPTER.dump_json(result), media_type="application/json")
+
+
+def _json_list_response(results: List[PredictionResult]) -> Response:
+    """Serialize a list of results to a JSON array response"""
+    return Response(content=_RESULTS_ADAPTER.dump_json(results), media_type="application/json")
+
 
+def _heart_result(result: Dict[str, Any]) -> PredictionResult:
+    """Wrap a heart engine result without re-validating it"""
+    # Every field is passed, in declared order, so the JSON key order
+    # matches a validated PredictionResult
+    return PredictionResult.model_construct(
+        success=True,
+        prediction=result['prediction'],
+        confidence=result['confidence'],
+        risk_score=result['risk_score'],
+        probability=None,
+        risk_factors=result['risk_factors'],
+        recommendation=result['recommendation'],
+        color=result['color'],
+        model_name=result['model_name'],
+        model_version=result['model_version'],
+        timestamp=clock.now.iso()
+    )
 
-@router.post("/heart", response_model=PredictionResult, summary="Heart Disease Risk Calculator")
-async def predict_heart_simple(request: SimpleHeartRequest):
+
+def _diabetes_result(result: Dict[str, Any]) -> PredictionResult:
+    """Wrap a diabetes engine result without re-validating it"""
+    return PredictionResult.model_construct(
+        success=True,
+        prediction=result['prediction'],
+        confidence=result['confidence'],
+        risk_score=None,
+        probability=result['probability'],
+        risk_factors=result['risk_factors'],
+        recommendation=result['recommendation'],
+        color=result['color'],
+        model_name=result['model_name'],
+        model_version=result['model_version'],
+        timestamp=clock.now.iso()
+    )
+
+
+@router.post("/heart", response_model=None, responses={200: {"model": PredictionResult}}, openapi_extra=_json_body(SimpleHeartRequest), summary="Heart Disease Risk Calculator")
+async def predict_heart_simple(raw_request: Request):
     """
     ## Heart Disease Risk Assessment
     
@@ -64,33 +250,31 @@ async def predict_heart_simple(request: SimpleHeartRequest):
     
     **Returns:** Risk score, confidence, and medical recommendations
     """
+    request = await _parse_body(raw_request, _HEART_ADAPTER)
     try:
-        # Call mock prediction engine
-        result = mock_engine.predict_heart_disease(request.dict())
-        
-        logger.info(f"Heart prediction: {result['prediction']} (confidence: {result['confidence']})")
+        # Call mock prediction engine through the batcher
+        row = np.array((_heart_row(request),), dtype=np.float32)
+        result = (await _heart_batcher.submit(row))[0]
         
-        return PredictionResult(
-            prediction=result['prediction'],
-            confidence=result['confidence'],
-            risk_score=result['risk_score'],
-            risk_factors=result['risk_factors'],
-            recommendation=result['recommendation'],
-            color=result['color'],
-            model_name=result['model_name'],
-            model_version=result['model_version']
+        _log_sampled(
+            "Heart prediction: %s (confidence: %s)", result['prediction'], result['confidence'],
+            extra={"model_name": "heart", "confidence": result['confidence']}
         )
         
+        return _json_response(_heart_result(result))
+        
+    except asyncio.QueueFull:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=_BUSY_DETAIL)
     except Exception as e:
-        logger.error(f"Heart prediction error: {e}")
+        logger.error("Heart prediction error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Prediction failed: {str(e)}"
         )
 
 
-@router.post("/diabetes", response_model=PredictionResult, summary="Diabetes Risk Calculator")
-async def predict_diabetes_simple(request: SimpleDiabetesRequest):
+@router.post("/diabetes", response_model=None, responses={200: {"model": PredictionResult}}, openapi_extra=_json_body(SimpleDiabetesRequest), summary="Diabetes Risk Calculator")
+async def predict_diabetes_simple(raw_request: Request):
     """
     ## Diabetes Risk Assessment
     
@@ -108,36 +292,84 @@ async def predict_diabetes_simple(request: SimpleDiabetesRequest):
     
     **Returns:** Risk probability, factors, and health advice
     """
+    request = await _parse_body(raw_request, _DIABETES_ADAPTER)
     try:
-        result = mock_engine.predict_diabetes(request.dict())
-        
-        logger.info(f"Diabetes prediction: {result['prediction']} (probability: {result['probability']})")
+        row = np.array((_diabetes_row(request),), dtype=np.float64)
+        result = (await _diabetes_batcher.submit(row))[0]
         
-        return PredictionResult(
-            prediction=result['prediction'],
-            confidence=result['confidence'],
-            probability=result['probability'],
-            risk_factors=result['risk_factors'],
-            recommendation=result['recommendation'],
-            color=result['color'],
-            model_name=result['model_name'],
-            model_version=result['model_version']
+        _log_sampled(
+            "Diabetes prediction: %s (probability: %s)", result['prediction'], result['probability'],
+            extra={"model_name": "diabetes", "confidence": result['confidence']}
         )
         
+        return _json_response(_diabetes_result(result))
+        
+    except asyncio.QueueFull:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=_BUSY_DETAIL)
     except Exception as e:
-        logger.error(f"Diabetes prediction error: {e}")
+        logger.error("Diabetes prediction error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Prediction failed: {str(e)}"
         )
 
 
+@router.post("/heart/batch", response_model=None, responses={200: {"model": List[PredictionResult]}}, summary="Heart Disease Risk for many patients")
+async def predict_heart_batch(request: HeartBatchRequest):
+    """
+    Score up to 256 patients in one request
+
+    Rows go through the same batcher as /heart in a single submission,
+    so high-volume clients pay the HTTP and JSON overhead once per batch
+    """
+    try:
+        rows = np.array([_heart_row(p) for p in request.patients], dtype=np.float32)
+        results = await _heart_batcher.submit(rows)
+        _log_sampled("Heart batch prediction: %d patients", len(results), extra={"model_name": "heart"})
+        return _json_list_response([_heart_result(r) for r in results])
+
+    except asyncio.QueueFull:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=_BUSY_DETAIL)
+    except Exception as e:
+        logger.error("Heart batch prediction error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Prediction failed: {str(e)}"
+        )
+
+
+@router.post("/diabetes/batch", response_model=None, responses={200: {"model": List[PredictionResult]}}, summary="Diabetes Risk for many patients")
+async def predict_diabetes_batch_route(request: DiabetesBatchRequest):
+    """Score up to 256 patients in one request (see /heart/batch)"""
+    try:
+        rows = np.array([_diabetes_row(p) for p in request.patients], dtype=np.float64)
+        results = await _diabetes_batcher.submit(rows)
+        _log_sampled("Diabetes batch prediction: %d patients", len(results), extra={"model_name": "diabetes"})
+        return _json_list_response([_diabetes_result(r) for r in results])
+
+    except asyncio.QueueFull:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=_BUSY_DETAIL)
+    except Exception as e:
+        logger.error("Diabetes batch prediction error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Prediction failed: {str(e)}"
+        )
+
+
+# Everything but the timestamp is fixed, so the body is prebuilt once
+_TEST_BODY_PREFIX = orjson.dumps({
+    "status": "healthy",
+    "message": "Prediction API is working!",
+    "available_endpoints": [
+        "/api/predict/heart", "/api/predict/diabetes",
+        "/api/predict/heart/batch", "/api/predict/diabetes/batch",
+    ],
+})[:-1] + b',"timestamp":"'
+
+
 @router.get("/test", summary="Test API connectivity")
 async def test_predictions():
     """Quick test endpoint to verify API is working"""
-    return {
-        "status": "healthy",
-        "message": "Prediction API is working!",
-        "available_endpoints": ["/api/predict/heart", "/api/predict/diabetes"],
-        "timestamp": datetime.now().isoformat()
-    }
+    body = _TEST_BODY_PREFIX + clock.now.iso().encode() + b'"}'
+    return Response(content=body, media_type="application/json")
@@ -6,6 +6,8 @@ from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field, confloat, conint
 from datetime import datetime
 
+from src.api import clock
+
 
 # ============================================================================
 # Health Check Schemas
@@ -14,7 +16,7 @@ from datetime import datetime
 class HealthCheckResponse(BaseModel):
     """Health check response"""
     status: str = Field(..., description="Service health status")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=clock.utcnow)
     version: str = Field(..., description="API version")
 
 
@@ -44,7 +46,7 @@ class PredictionResponse(BaseModel):
     confidence: confloat(ge=0.0, le=1.0) = Field(..., description="Prediction confidence score")
     model_version: str = Field(..., description="Model version used")
     model_name: str = Field(..., description="Model name")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=clock.utcnow)
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
     fallback_used: bool = Field(default=False, description="Whether fallback logic was triggered")
 
@@ -226,5 +228,5 @@ class ErrorResponse(BaseModel):
     """Error response schema"""
     error: str = Field(..., description="Error message")
     detail: Optional[str] = Field(default=None, description="Detailed error information")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=clock.utcnow)
     request_id: Optional[str] = Field(default=None)
@@ -3,11 +3,170 @@ Data validation utilities
 Input validation and quality checks
 """
 
+import math
 import numpy as np
 from typing import Dict, List, Any
 from pydantic import BaseModel, ValidationError
 from src.monitoring.logger import logger
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _scan_loop(values: np.ndarray, threshold: float):
+    """
+    Scalar form of the scan, compiled with numba when it is installed
+    Returns (missing_count, std, min, max, outlier_count)
+    """
+    count = 0
+    missing = 0
+    mean = 0.0
+    m2 = 0.0
+    lowest = math.inf
+    highest = -math.inf
+    for v in values:
+        if math.isnan(v):
+            missing += 1
+            continue
+        count += 1
+        delta = v - mean
+        mean += delta / count
+        m2 += delta * (v - mean)
+        if v < lowest:
+            lowest = v
+        if v > highest:
+            highest = v
+    
+    if count == 0:
+        return missing, 0.0, math.nan, math.nan, 0
+    
+    std = math.sqrt(m2 / count)
+    outliers = 0
+    if std != 0:
+        limit = threshold * std
+        for v in values:
+            if not math.isnan(v) and abs(v - mean) > limit:
+                outliers += 1
+    return missing, std, lowest, highest, outliers
+
+
+if njit is not None:
+    _scan_kernel = njit(cache=True)(_scan_loop)
+    # Compile (or load from cache) up front, with the argument types _scan
+    # passes, so no validation call pays for the JIT
+    _scan_kernel(np.zeros(1, dtype=np.float64), 3.0)
+else:
+    _scan_kernel = None
+
+
+def _scan(data: np.ndarray, threshold: float = 3.0) -> Dict[str, Any]:
+    """
+    Gather every statistic the checks need from a single sweep of the data
+    NaNs are counted as missing and left out of the other statistics
+    """
+    values = np.asarray(data, dtype=np.float64).ravel()
+    if _scan_kernel is not None:
+        missing_count, std, lowest, highest, outliers = _scan_kernel(values, float(threshold))
+        return {
+            "total_values": int(data.size),
+            "missing_count": int(missing_count),
+            "std": float(std),
+            "outlier_count": int(outliers),
+            "min": float(lowest),
+            "max": float(highest),
+        }
+    
+    nan_mask = np.isnan(values)
+    missing_count = int(np.count_nonzero(nan_mask))
+    if missing_count:
+        values = values[~nan_mask]
+    
+    stats = {
+        "total_values": int(data.size),
+        "missing_count": missing_count,
+        "std": 0.0,
+        "outlier_count": 0,
+        "min": float("nan"),
+        "max": float("nan"),
+    }
+    if values.size:
+        diff = values - values.mean()
+        std = float(np.sqrt(np.dot(diff, diff) / values.size))
+        stats["std"] = std
+        stats["min"] = float(values.min())
+        stats["max"] = float(values.max())
+        if std != 0:
+            stats["outlier_count"] = int(np.count_nonzero(np.abs(diff) > threshold * std))
+    return stats
+
+
+def _missing_result(stats: Dict[str, Any]) -> Dict[str, Any]:
+    missing_count = stats["missing_count"]
+    total_values = stats["total_values"]
+    return {
+        "check": "missing_values",
+        "is_valid": missing_count == 0,
+        "missing_count": missing_count,
+        "  total_values": total_values,
+        "missing_percentage": (missing_count / total_values) * 100 if total_values else 0.0
+    }
+
+
+def _outlier_result(stats: Dict[str, Any], threshold: float) -> Dict[str, Any]:
+    if stats["std"] == 0:
+        return {
+            "check": "outliers",
+            "is_valid": True,
+            "outlier_count": 0,
+            "outlier_percentage": 0.0
+        }
+    
+    outlier_count = stats["outlier_count"]
+    total_values = stats["total_values"]
+    outlier_percentage = (outlier_count / total_values) * 100
+    
+    # Consider valid if less than 5% outliers
+    return {
+        "check": "outliers",
+        "is_valid": outlier_percentage < 5.0,
+        "outlier_count": outlier_count,
+        "total_values": total_values,
+        "outlier_percentage": outlier_percentage,
+        "threshold": threshold
+    }
+
+
+def _range_result(
+    stats: Dict[str, Any],
+    expected_min: float = None,
+    expected_max: float = None
+) -> Dict[str, Any]:
+    actual_min = stats["min"]
+    actual_max = stats["max"]
+    
+    is_valid = True
+    violations = []
+    
+    if expected_min is not None and actual_min < expected_min:
+        is_valid = False
+        violations.append(f"Minimum value {actual_min} < expected {expected_min}")
+    
+    if expected_max is not None and actual_max > expected_max:
+        is_valid = False
+        violations.append(f"Maximum value {actual_max} > expected {expected_max}")
+    
+    return {
+        "check": "value_ranges",
+        "is_valid": is_valid,
+        "actual_min": actual_min,
+        "actual_max": actual_max,
+        "expected_min": expected_min,
+        "expected_max": expected_max,
+        "violations": violations
+    }
+
 
 class DataValidator:
     """
@@ -26,19 +185,7 @@ class DataValidator:
         Returns:
             Validation result dictionary
         """
-        missing_count = np.isnan(data).sum()
-        total_values = data.size
-        missing_percentage = (missing_count / total_values) * 100
-        
-        is_valid = missing_count == 0
-        
-        return {
-            "check": "missing_values",
-            "is_valid": is_valid,
-            "missing_count": int(missing_count),
-            "  total_values": int(total_values),
-            "missing_percentage": float(missing_percentage)
-        }
+        return _missing_result(_scan(data))
     
     @staticmethod
     def check_outliers(data: np.ndarray, threshold: float = 3.0) -> Dict[str, Any]:
@@ -52,33 +199,7 @@ class DataValidator:
         Returns:
             Validation result dictionary
         """
-        mean = np.mean(data)
-        std = np.std(data)
-        
-        if std == 0:
-            return {
-                "check": "outliers",
-                "is_valid": True,
-                "outlier_count": 0,
-                "outlier_percentage": 0.0
-            }
-        
-        z_scores = np.abs((data - mean) / std)
-        outlier_count = np.sum(z_scores > threshold)
-        total_values = data.size
-        outlier_percentage = (outlier_count / total_values) * 100
-        
-        # Consider valid if less than 5% outliers
-        is_valid = outlier_percentage < 5.0
-        
-        return {
-            "check": "outliers",
-            "is_valid": is_valid,
-            "outlier_count": int(outlier_count),
-            "total_values": int(total_values),
-            "outlier_percentage": float(outlier_percentage),
-            "threshold": threshold
-        }
+        return _outlier_result(_scan(data, threshold), threshold)
     
     @staticmethod
     def check_value_ranges(
@@ -97,29 +218,7 @@ class DataValidator:
         Returns:
             Validation result dictionary
         """
-        actual_min = float(np.min(data))
-        actual_max = float(np.max(data))
-        
-        is_valid = True
-        violations = []
-        
-        if expected_min is not None and actual_min < expected_min:
-            is_valid = False
-            violations.append(f"Minimum value {actual_min} < expected {expected_min}")
-        
-        if expected_max is not None and actual_max > expected_max:
-            is_valid = False
-            violations.append(f"Maximum value {actual_max} > expected {expected_max}")
-        
-        return {
-            "check": "value_ranges",
-            "is_valid": is_valid,
-            "actual_min": actual_min,
-            "actual_max": actual_max,
-            "expected_min": expected_min,
-            "expected_max": expected_max,
-            "violations": violations
-        }
+        return _range_result(_scan(data), expected_min, expected_max)
     
     @classmethod
     def validate_input_data(
@@ -149,15 +248,19 @@ class DataValidator:
             "is_valid": True
         }
         
+        # All checks share one sweep over the data
+        threshold = 3.0
+        stats = _scan(data, threshold)
+        
         # Check missing values
-        missing_check = cls.check_missing_values(data)
+        missing_check = _missing_result(stats)
         results["checks"].append(missing_check)
         if not missing_check["is_valid"]:
             results["is_valid"] = False
         
         # Check outliers if requested
         if check_outliers:
-            outlier_check = cls.check_outliers(data)
+            outlier_check = _outlier_result(stats, threshold)
             results["checks"].append(outlier_check)
             if not outlier_check["is_valid"]:
                 results["is_valid"] = False
@@ -168,7 +271,7 @@ class DataValidator:
         
         # Check value ranges if specified
         if expected_min is not None or expected_max is not None:
-            range_check = cls.check_value_ranges(data, expected_min, expected_max)
+            range_check = _range_result(stats, expected_min, expected_max)
             results["checks"].append(range_check)
             if not range_check["is_valid"]:
                 results["is_valid"] = False
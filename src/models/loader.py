@@ -3,7 +3,10 @@ Model loader with caching and lazy loading
 Handles loading of TensorFlow and pickle models
 """
 
-import pickle
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional
 from src.models.registry import model_registry
@@ -21,14 +24,28 @@ def lazy_import_tensorflow():
         return None
 
 
+def lazy_import_joblib_load():
+    """Lazy import joblib (ships with scikit-learn) - only when loading .pkl models"""
+    try:
+        from joblib import load as joblib_load
+        return joblib_load
+    except ImportError:
+        return None
+
+
 class ModelLoader:
     """
     Singleton model loader with caching
-    Lazy loads models on first request and caches them
+    Lazy loads models on first request and keeps the most recently used
+    MODEL_CACHE_SIZE of them
     """
     
     _instance = None
-    _models_cache: Dict[str, Any] = {}
+    _models_cache: "OrderedDict[str, Any]" = OrderedDict()
+    _cache_lock = threading.RLock()
+    _load_locks: Dict[str, threading.Lock] = {}
+    _load_locks_guard = threading.Lock()
+    _io_executor: Optional[ThreadPoolExecutor] = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -60,11 +77,71 @@ class ModelLoader:
         cache_key = f"{model_name}:{version}"
         
         # Check cache
-        if cache_key in self._models_cache:
-            logger.debug(f"Loading {model_name} v{version} from cache")
-            return self._models_cache[cache_key]
+        model = self._cache_get(cache_key)
+        if model is not None:
+            return model
         
-        # Load model
+        # Only one thread loads a given model; the others wait for it and
+        # then find the model in the cache
+        with self._load_lock(cache_key):
+            model = self._cache_get(cache_key)
+            if model is not None:
+                return model
+            return self._load_model(model_name, version, cache_key)
+    
+    async def get_model_async(self, model_name: str, version: str = None) -> Any:
+        """
+        Get a model without blocking the event loop
+        
+        Cached models are returned directly; loads run on a dedicated
+        model-io thread pool so slow disk reads don't tie up the default
+        executor used by asyncio.to_thread
+        """
+        if version is None:
+            version = self.registry.get_active_version(model_name)
+        model = self._cache_get(f"{model_name}:{version}")
+        if model is not None:
+            return model
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_io_executor(), self.get_model, model_name, version)
+    
+    def _get_io_executor(self) -> ThreadPoolExecutor:
+        """Get (or create) the thread pool used for model loads"""
+        with self._load_locks_guard:
+            if ModelLoader._io_executor is None:
+                ModelLoader._io_executor = ThreadPoolExecutor(
+                    max_workers=self.settings.max_workers,
+                    thread_name_prefix="model-io"
+                )
+            return ModelLoader._io_executor
+    
+    def _cache_get(self, cache_key: str) -> Any:
+        """Look up a cached model, marking it most recently used"""
+        with self._cache_lock:
+            model = self._models_cache.get(cache_key)
+            if model is not None:
+                self._models_cache.move_to_end(cache_key)
+            return model
+    
+    def _cache_put(self, cache_key: str, model: Any):
+        """Cache a model, evicting the least recently used beyond MODEL_CACHE_SIZE"""
+        with self._cache_lock:
+            self._models_cache[cache_key] = model
+            self._models_cache.move_to_end(cache_key)
+            while len(self._models_cache) > max(self.settings.model_cache_size, 1):
+                evicted, _ = self._models_cache.popitem(last=False)
+                logger.info("Evicted model %s from cache", evicted)
+    
+    def _load_lock(self, cache_key: str) -> threading.Lock:
+        """Get (or create) the lock guarding loads of one cache key"""
+        with self._load_locks_guard:
+            lock = self._load_locks.get(cache_key)
+            if lock is None:
+                lock = self._load_locks[cache_key] = threading.Lock()
+            return lock
+    
+    def _load_model(self, model_name: str, version: str, cache_key: str) -> Any:
+        """Load a model from disk and store it in the cache"""
         model_path = self.registry.get_model_path(model_name, version)
         
         if not model_path.exists():
@@ -82,13 +159,20 @@ class ModelLoader:
                     raise RuntimeError("TensorFlow not available")
                 model = tf_load_model(str(model_path))
             elif model_path.suffix == '.pkl':
-                with open(model_path, 'rb') as f:
-                    model = pickle.load(f)
+                # joblib memory-maps the numpy arrays in joblib.dump'ed models,
+                # so worker processes share their pages; plain pickles load as usual
+                joblib_load = lazy_import_joblib_load()
+                if joblib_load is not None:
+                    model = joblib_load(str(model_path), mmap_mode='r')
+                else:
+                    import pickle
+                    with open(model_path, 'rb') as f:
+                        model = pickle.load(f)
             else:
                 raise ValueError(f"Unsupported model file type: {model_path.suffix}")
             
             # Cache the model
-            self._models_cache[cache_key] = model
+            self._cache_put(cache_key, model)
             
             logger.info(
                 f"Successfully loaded {model_name} v{version}",
@@ -119,8 +203,9 @@ class ModelLoader:
         cache_key = f"{model_name}:{version}"
         
         # Clear from cache
-        if cache_key in self._models_cache:
-            del self._models_cache[cache_key]
+        with self._cache_lock:
+            removed = self._models_cache.pop(cache_key, None) is not None
+        if removed:
             logger.info(f"Cleared cache for {model_name} v{version}")
         
         # Reload
@@ -144,9 +229,9 @@ class ModelLoader:
             logger.warning(f"Model validation failed for {model_name}: {e}")
             return False
     
-    def preload_models(self, model_names: list = None):
+    async def preload_models(self, model_names: list = None):
         """
-        Preload models into cache
+        Preload models into cache, loading them concurrently in worker threads
         
         Args:
             model_names: List of model names to preload (preloads all if None)
@@ -162,25 +247,39 @@ class ModelLoader:
                 "parkinsons"
             ]
         
-        for model_name in model_names:
-            try:
-                self.get_model(model_name)
+        results = await asyncio.gather(
+            *(self.get_model_async(model_name) for model_name in model_names),
+            return_exceptions=True
+        )
+        for model_name, result in zip(model_names, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to preload {model_name}: {result}")
+            else:
                 logger.info(f"Preloaded {model_name}")
-            except Exception as e:
-                logger.warning(f"Failed to preload {model_name}: {e}")
     
     def clear_cache(self):
         """Clear all cached models"""
-        count = len(self._models_cache)
-        self._models_cache.clear()
+        with self._cache_lock:
+            count = len(self._models_cache)
+            self._models_cache.clear()
         logger.info(f"Cleared {count} models from cache")
     
+    def shutdown(self):
+        """Clear the cache and stop the model-io thread pool"""
+        self.clear_cache()
+        with self._load_locks_guard:
+            executor, ModelLoader._io_executor = ModelLoader._io_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
     def get_cache_info(self) -> Dict:
         """Get information about cached models"""
-        return {
-            "cached_models": list(self._models_cache.keys()),
-            "cache_size": len(self._models_cache)
-        }
+        with self._cache_lock:
+            return {
+                "cached_models": list(self._models_cache.keys()),
+                "cache_size": len(self._models_cache),
+                "max_cache_size": self.settings.model_cache_size
+            }
 
 
 # Global loader instance
@@ -3,307 +3,561 @@ Mock Prediction Engine
 Smart rule-based predictions for demo/testing
 Can be replaced with real ML models later
 """
-from typing import Dict, Any, List
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Dict, Any, Final, List, Mapping, NamedTuple, Optional, Tuple
 import random
+import sys
 
+import numpy as np
 
-class MockPredictionEngine:
-    """Intelligent mock predictions based on medical logic"""
+# Column order for the batched entry points
+HEART_FEATURES = ("age", "chol", "trestbps", "cp", "fbs")
+DIABETES_FEATURES = ("glucose", "bmi", "age", "blood_pressure")
+LIVER_FEATURES = (
+    "age", "total_bilirubin", "alkaline_phosphotase",
+    "alamine_aminotransferase", "aspartate_aminotransferase"
+)
+
+# Scoring is deterministic, so the lab/voice predictors memoize results per
+# input. Heart and diabetes are served through the batch scorers and are
+# not cached (a rule lookup costs ~2-3 us, about as much as a cache probe
+# per row plus the bookkeeping)
+_LAB_RESULT_CACHE_SIZE = 4096
+
+# Display colors shared by every outcome table
+GREEN: Final = "green"
+ORANGE: Final = "orange"
+RED: Final = "red"
+
+# Risk factors are returned as tuples; the low-risk messages are shared
+HEART_NO_RISK_FACTORS = tuple(sys.intern(s) for s in (
+    "No major risk factors identified",
+    "Blood pressure within healthy range",
+    "Cholesterol levels acceptable",
+))
+DIABETES_NO_RISK_FACTORS = tuple(sys.intern(s) for s in (
+    "No major risk factors identified",
+    "Glucose within healthy range",
+    "BMI within optimal range",
+))
+LIVER_NO_RISK_FACTORS = (sys.intern("All liver markers within normal range"),)
+PARKINSONS_NO_INDICATORS = (sys.intern("All voice measurements within healthy parameters"),)
+
+
+class _Rule(NamedTuple):
+    """
+    Threshold rule for one feature column
+
+    A value falls in bucket np.digitize(value, bins, right), which adds
+    scores[i] to the risk score, scales the severity multiplier by mult[i]
+    and reports msgs[i] (formatted with the value) when it is non-empty.
+    Buckets include their lower bound, or their upper bound when right is set
+    """
+    column: int
+    bins: np.ndarray
+    scores: np.ndarray
+    mult: np.ndarray
+    msgs: tuple
+    right: bool
+
+
+def _rule(column: int, bins, scores, msgs=None, mult=None, right=False) -> _Rule:
+    """Build a _Rule from plain sequences (no messages, mult all ones by default)"""
+    return _Rule(
+        column,
+        np.array(bins),
+        np.array(scores),
+        np.ones(len(scores)) if mult is None else np.array(mult),
+        ("",) * len(scores) if msgs is None else tuple(msgs),
+        right
+    )
+
+
+class _RuleSet:
+    """
+    Threshold rules of one tabular predictor
+
+    Every combination of buckets is scored once up front (summed and
+    multiplied in rule order, like the scalar predictors, so the floats
+    match them exactly). A batch is then bucketed column-wise and each row
+    looks up its combination by key
+    """
+
+    def __init__(self, rules: Tuple[_Rule, ...], column_types: tuple):
+        self.rules = rules
+        self.column_types = column_types
+        self.shape = tuple(len(rule.bins) + 1 for rule in rules)
+        # Per bucket, a template's bound str.format (None for fixed text)
+        # and the text itself, so fixed messages are never formatted
+        self._messages = tuple(
+            tuple((msg.format if "{" in msg else None, msg) for msg in rule.msgs)
+            for rule in rules
+        )
+        # (column, bisect, bins, key stride, messages) per rule for the scalar path
+        self._steps = tuple(
+            (
+                rule.column,
+                bisect_left if rule.right else bisect_right,
+                tuple(rule.bins.tolist()),
+                int(np.prod(self.shape[k + 1:])),
+                messages
+            )
+            for k, (rule, messages) in enumerate(zip(rules, self._messages))
+        )
+        grid = np.indices(self.shape).reshape(len(rules), -1)
+        score = rules[0].scores[grid[0]]
+        mult = rules[0].mult[grid[0]]
+        for rule, idx in zip(rules[1:], grid[1:]):
+            score = score + rule.scores[idx]
+            mult = mult * rule.mult[idx]
+        # Final (capped) score of every bucket combination, by key
+        self.scores = np.minimum(score * mult, 1.0)
+
+    def row(self, values: tuple) -> Tuple[int, tuple]:
+        """Scalar form of rows(): (combination key, risk factors) for one row"""
+        key = 0
+        factors = []
+        for column, bisect, bounds, stride, messages in self._steps:
+            value = values[column]
+            i = bisect(bounds, value)
+            key += i * stride
+            fmt, msg = messages[i]
+            if fmt is not None:
+                factors.append(fmt(value))
+            elif msg:
+                factors.append(msg)
+        return key, tuple(factors)
     
-    @staticmethod
-    def predict_heart_disease(data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Enhanced heart disease risk prediction based on clinical guidelines
-        Uses improved risk scoring similar to Framingham/ACC-AHA models
-        
-        Factors weighted by medical importance:
-        - age: Progressive risk increase
-        - cholesterol: LDL threshold-based
-        - blood pressure: Stage-based classification
-        - chest pain: Symptom severity indicator
-        - fasting blood sugar: Diabetes marker
-        """
-        age = int(data.get('age', 50))
-        chol = int(data.get('chol', 200))
-        trestbps = int(data.get('trestbps', 120))
-        cp = int(data.get('cp', 0))
-        fbs = int(data.get('fbs', 0))
-        
-        # Improved risk scoring algorithm
-        risk_score = 0.0
-        risk_factors = []
-        severity_multiplier = 1.0
-        
-        # Age (progressive risk - most important factor)
-        if age >= 65:
-            risk_score += 0.35
-            severity_multiplier *= 1.3
-            risk_factors.append(f"Advanced age ({age}) - significantly elevated risk")
-        elif age >= 55:
-            risk_score += 0.25
-            severity_multiplier *= 1.15
-            risk_factors.append(f"Age ({age}) - moderately elevated risk")
-        elif age >= 45:
-            risk_score += 0.12
-            risk_factors.append(f"Age ({age}) - mild risk elevation")
-        
-        # Cholesterol (LDL-based thresholds)
-        if chol >= 280:
-            risk_score += 0.30
-            severity_multiplier *= 1.25
-            risk_factors.append(f"Very high cholesterol ({chol} mg/dL) - requires medication")
-        elif chol >= 240:
-            risk_score += 0.22
-            severity_multiplier *= 1.15
-            risk_factors.append(f"High cholesterol ({chol} mg/dL) - medical intervention needed")
-        elif chol >= 200:
-            risk_score += 0.10
-            risk_factors.append(f"Borderline high cholesterol ({chol} mg/dL)")
-        elif chol < 170:
-            risk_score -= 0.05  # Protective factor
-        
-        # Blood Pressure (Stage-based)
-        if trestbps >= 160:
-            risk_score += 0.28
-            severity_multiplier *= 1.2
-            risk_factors.append(f"Stage 2 hypertension ({trestbps} mmHg) - urgent treatment")
-        elif trestbps >= 140:
-            risk_score += 0.18
-            severity_multiplier *= 1.1
-            risk_factors.append(f"Stage 1 hypertension ({trestbps} mmHg)")
-        elif trestbps >= 130:
-            risk_score += 0.08
-            risk_factors.append(f"Elevated blood pressure ({trestbps} mmHg)")
-        elif trestbps < 120:
-            risk_score -= 0.03  # Optimal BP
-        
-        # Chest Pain (Strong symptom indicator)
-        if cp == 3:  # Asymptomatic (paradoxically worse in heart disease)
-            risk_score += 0.18
-            severity_multiplier *= 1.15
-            risk_factors.append("Atypical chest pain pattern - requires investigation")
-        elif cp == 2:
-            risk_score += 0.12
-            risk_factors.append("Non-anginal chest pain detected")
-        elif cp == 1:
-            risk_score += 0.08
-            risk_factors.append("Atypical angina symptoms")
-        
-        # Fasting Blood Sugar (Diabetes indicator)
-        if fbs == 1:
-            risk_score += 0.18
-            severity_multiplier *= 1.12
-            risk_factors.append("Elevated fasting blood sugar - diabetes concern")
-        
-        # Apply severity multiplier
-        risk_score = min(risk_score * severity_multiplier, 1.0)
-        
-        # Enhanced risk classification
-        if risk_score >= 0.75:
-            prediction = "Critical Risk"
-            recommendation = "⚠️ URGENT: Immediate cardiology consultation required. Schedule ECG and stress test."
-            color = "red"
-        elif risk_score >= 0.60:
-            prediction = "High Risk"
-            recommendation = "Consult cardiologist within 1 week. Lifestyle modifications and medication likely needed."
-            color = "red"
-        elif risk_score >= 0.40:
-            prediction = "Moderate Risk"
-            recommendation = "Schedule checkup with healthcare provider. Start lifestyle changes (diet, exercise)."
-            color = "orange"
-        elif risk_score >= 0.20:
-            prediction = "Low-Moderate Risk"
-            recommendation = "Monitor regularly. Maintain healthy lifestyle and annual checkups."
-            color = "orange"
-        else:
-            prediction = "Low Risk"
-            recommendation = "Continue healthy lifestyle. Regular checkups recommended."
-            color = "green"
-        
-        # Confidence based on data quality and risk extremity
-        confidence = 0.78 + (abs(risk_score - 0.5) * 0.35)
-        confidence = min(confidence, 0.98)
-        
-        # Add protective factors if low risk
-        if not risk_factors:
-            risk_factors.append("No major risk factors identified")
-            risk_factors.append("Blood pressure within healthy range")
-            risk_factors.append("Cholesterol levels acceptable")
-        
-        return {
-            "prediction": prediction,
-            "risk_score": round(risk_score, 3),
-            "confidence": round(confidence, 3),
-            "risk_factors": risk_factors,
-            "recommendation": recommendation,
-            "color": color,
-            "model_name": "heart_disease",
-            "model_version": "v1.1_enhanced"
-        }
+    def buckets(self, X, xp=np) -> Tuple[list, list]:
+        """Typed columns of X and each rule's bucket indices, using array module xp (numpy or cupy)"""
+        X = xp.asarray(X)
+        columns = [
+            X[:, j].astype(xp.int64 if kind is int else xp.float64)
+            for j, kind in enumerate(self.column_types)
+        ]
+        buckets = [
+            xp.digitize(columns[rule.column], xp.asarray(rule.bins), rule.right)
+            for rule in self.rules
+        ]
+        return columns, buckets
     
-    @staticmethod
-    def predict_diabetes(data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Enhanced diabetes risk prediction based on ADA guidelines
-        Uses HbA1c thresholds and metabolic syndrome criteria
-        
-        Factors weighted by diagnostic importance:
-        - glucose: Fasting plasma glucose (FPG) - primary diagnostic
-        - bmi: Obesity indicator - major risk factor
-        - age: Progressive risk
-        - blood_pressure: Metabolic syndrome component
-        """
-        glucose = float(data.get('glucose', 100))
-        bmi = float(data.get('bmi', 25))
-        age = int(data.get('age', 40))
-        bp = int(data.get('blood_pressure', 80))
-        
-        probability = 0.0
-        factors = []
-        severity_multiplier = 1.0
-        
-        # Glucose (ADA diagnostic criteria - most critical)
-        if glucose >= 126:
-            # Definitive diabetes threshold (fasting)
-            probability += 0.55
-            severity_multiplier *= 1.4
-            factors.append(f"🔴 Glucose {glucose} mg/dL meets diabetes diagnostic criteria (≥126)")
-        elif glucose >= 115:
-            # High pre-diabetic
-            probability += 0.35
-            severity_multiplier *= 1.25
-            factors.append(f"🟠 Glucose {glucose} mg/dL - high pre-diabetic range")
-        elif glucose >= 100:
-            # IFG (Impaired Fasting Glucose)
-            probability += 0.22
-            severity_multiplier *= 1.1
-            factors.append(f"⚠️  Glucose {glucose} mg/dL - impaired fasting glucose (IFG)")
-        elif glucose >= 90:
-            probability += 0.08
-            factors.append(f"Glucose {glucose} mg/dL - acceptable but monitor")
-        else:
-            probability -= 0.05  # Protective
-        
-        # BMI (Strong independent risk factor)
-        if bmi >= 35:
-            # Class II obesity
-            probability += 0.25
-            severity_multiplier *= 1.3
-            factors.append(f"Severe obesity (BMI {bmi:.1f}) - very high diabetes risk")
-        elif bmi >= 30:
-            # Obese
-            probability += 0.18
-            severity_multiplier *= 1.15
-            factors.append(f"Obesity (BMI {bmi:.1f}) - increased diabetes risk")
-        elif bmi >= 27:
-            probability += 0.12
-            factors.append(f"Overweight (BMI {bmi:.1f}) - moderate risk factor")
-        elif bmi >= 25:
-            probability += 0.06
-            factors.append(f"Overweight (BMI {bmi:.1f}) - mild risk")
-        elif bmi < 23:
-            probability -= 0.03  # Healthy weight protective
-        
-        # Age (Risk increases with age, especially >45)
-        if age >= 65:
-            probability += 0.15
-            severity_multiplier *= 1.15
-            factors.append(f"Age {age} - significantly increased diabetes prevalence")
-        elif age >= 55:
-            probability += 0.11
-            factors.append(f"Age {age} - elevated diabetes risk")
-        elif age >= 45:
-            probability += 0.07
-            factors.append(f"Age {age} - increased diabetes screening recommended")
-        
-        # Blood Pressure (Metabolic syndrome component)
-        if bp >= 95:
-            probability += 0.12
-            severity_multiplier *= 1.08
-            factors.append(f"Elevated BP ({bp} mmHg) - metabolic syndrome indicator")
-        elif bp >= 85:
-            probability += 0.06
-            factors.append(f"Borderline BP ({bp} mmHg) - watch metabolic health")
-        
-        # Apply severity multiplier
-        probability = min(probability * severity_multiplier, 1.0)
-        
-        # Enhanced classification with specific guidance
-        if probability >= 0.70:
-            prediction = "Diabetes Highly Likely"
-            recommendation = "🔴 URGENT: See doctor immediately for HbA1c test and diabetes management. Start blood sugar monitoring."
-            color = "red"
-        elif probability >= 0.50:
-            prediction = "High Risk - Probable Diabetes"
-            recommendation = "Schedule urgent appointment for fasting glucose and HbA1c testing. Likely requires medication."
-            color = "red"
-        elif probability >= 0.35:
-            prediction = "Pre-Diabetic Range"
-            recommendation = "See doctor within 2 weeks. Start lifestyle changes: lose 5-7% body weight, exercise 150min/week."
-            color = "orange"
-        elif probability >= 0.20:
-            prediction = "Moderate Risk"
-            recommendation = "Annual screening recommended. Focus on weight management and physical activity."
-            color = "orange"
-        else:
-            prediction = "Low Risk"
-            recommendation = "Continue healthy habits. Screen every 3 years if no risk factors."
-            color = "green"
-        
-        # High confidence for glucose-based diagnoses
-        confidence = 0.82 + (abs(probability - 0.5) * 0.28)
-        confidence = min(confidence, 0.97)
-        
-        # Add protective factors messaging
-        if not factors:
-            factors.append("No major risk factors identified")
-            factors.append("Glucose within healthy range")
-            factors.append("BMI within optimal range")
-        
-        # BMI category
-        bmi_category = (
-            "Underweight" if bmi < 18.5 else
-            "Normal" if bmi < 25 else
-            "Overweight" if bmi < 30 else
-            "Obese Class I" if bmi < 35 else
-            "Obese Class II+"
-        )
-        
-        return {
-            "prediction": prediction,
-            "probability": round(probability, 3),
-            "confidence": round(confidence, 3),
-            "risk_factors": factors,
-            "recommendation": recommendation,
-            "color": color,
-            "model_name": "diabetes",
-            "model_version": "v1.1_ada_enhanced",
-            "glucose_level": glucose,
-            "bmi_category": bmi_category
-        }
+    def rows(self, X):
+        """Yield (column values, combination key, risk factors) for each row of X"""
+        columns, buckets = self.buckets(X)
+        keys = np.ravel_multi_index(buckets, self.shape).tolist()
+        values = [column.tolist() for column in columns]
+        # Messages are formatted a column at a time, then gathered per row
+        messages = [
+            _format_messages(rule_messages, b.tolist(), values[rule.column])
+            for rule, rule_messages, b in zip(self.rules, self._messages, buckets)
+        ]
+        for row, key, factors in zip(zip(*values), keys, zip(*messages)):
+            yield row, key, tuple(filter(None, factors))
+
+
+def _format_messages(messages: tuple, buckets: list, values: list) -> list:
+    """Message of each value's bucket ("" where there is none), see _RuleSet._messages"""
+    return [
+        msg if fmt is None else fmt(value)
+        for (fmt, msg), value in zip(map(messages.__getitem__, buckets), values)
+    ]
+
+
+def _result(outcome: dict, **fields) -> Mapping[str, Any]:
+    """Read-only copy of a precomputed outcome with the per-row fields filled in"""
+    result = outcome.copy()
+    result.update(fields)
+    return MappingProxyType(result)
+
+
+def _build_outcomes(
+    rules: _RuleSet,
+    score_key: str,
+    confidence: tuple,
+    risk_bins,
+    risk_classes,
+    fields: dict,
+    factors_key: Optional[str] = "risk_factors"
+) -> tuple:
+    """
+    Result dict of every bucket combination of rules (factors left empty)
+
+    confidence is (base, slope, cap) of base + |score - 0.5| * slope, capped
+    at cap unless it is None; risk_classes are (prediction, recommendation,
+    color) triples for the intervals of risk_bins. Results without a list
+    of factors pass factors_key=None
+    """
+    base, slope, cap = confidence
+    conf = base + np.abs(rules.scores - 0.5) * slope
+    if cap is not None:
+        conf = np.minimum(conf, cap)
+    risk_class = np.digitize(rules.scores, risk_bins)
+
+    outcomes = []
+    for s, c, k in zip(rules.scores.tolist(), conf.tolist(), risk_class.tolist()):
+        prediction, recommendation, color = risk_classes[k]
+        outcome = {"prediction": prediction, score_key: round(s, 3), "confidence": round(c, 3)}
+        if factors_key is not None:
+            outcome[factors_key] = ()
+        outcome.update(recommendation=recommendation, color=color, **fields)
+        outcomes.append(outcome)
+    return tuple(outcomes)
+
+
+_HEART_RULES = _RuleSet((
+    _rule(0, [45, 55, 65], [0.0, 0.12, 0.25, 0.35], (
+        "",
+        "Age ({}) - mild risk elevation",
+        "Age ({}) - moderately elevated risk",
+        "Advanced age ({}) - significantly elevated risk",
+    ), mult=[1.0, 1.0, 1.15, 1.3]),
+    _rule(1, [170, 200, 240, 280], [-0.05, 0.0, 0.10, 0.22, 0.30], (
+        "",
+        "",
+        "Borderline high cholesterol ({} mg/dL)",
+        "High cholesterol ({} mg/dL) - medical intervention needed",
+        "Very high cholesterol ({} mg/dL) - requires medication",
+    ), mult=[1.0, 1.0, 1.0, 1.15, 1.25]),
+    _rule(2, [120, 130, 140, 160], [-0.03, 0.0, 0.08, 0.18, 0.28], (
+        "",
+        "",
+        "Elevated blood pressure ({} mmHg)",
+        "Stage 1 hypertension ({} mmHg)",
+        "Stage 2 hypertension ({} mmHg) - urgent treatment",
+    ), mult=[1.0, 1.0, 1.0, 1.1, 1.2]),
+    # cp and fbs are categorical; values outside 1-3 / 1 contribute nothing
+    _rule(3, [1, 2, 3, 4], [0.0, 0.08, 0.12, 0.18, 0.0], (
+        "",
+        "Atypical angina symptoms",
+        "Non-anginal chest pain detected",
+        "Atypical chest pain pattern - requires investigation",
+        "",
+    ), mult=[1.0, 1.0, 1.0, 1.15, 1.0]),
+    _rule(4, [1, 2], [0.0, 0.18, 0.0], (
+        "", "Elevated fasting blood sugar - diabetes concern", "",
+    ), mult=[1.0, 1.12, 1.0]),
+), (int, int, int, int, int))
+
+_HEART_OUTCOMES = _build_outcomes(
+    _HEART_RULES, "risk_score", (0.78, 0.35, 0.98), [0.20, 0.40, 0.60, 0.75], (
+        ("Low Risk", "Continue healthy lifestyle. Regular checkups recommended.", GREEN),
+        ("Low-Moderate Risk", "Monitor regularly. Maintain healthy lifestyle and annual checkups.", ORANGE),
+        ("Moderate Risk", "Schedule checkup with healthcare provider. Start lifestyle changes (diet, exercise).", ORANGE),
+        ("High Risk", "Consult cardiologist within 1 week. Lifestyle modifications and medication likely needed.", RED),
+        ("Critical Risk", "⚠️ URGENT: Immediate cardiology consultation required. Schedule ECG and stress test.", RED),
+    ),
+    {"model_name": "heart_disease", "model_version": "v1.1_enhanced"}
+)
+_HEART_RISK_SCORES = np.array([outcome["risk_score"] for outcome in _HEART_OUTCOMES])
+
+_DIABETES_RULES = _RuleSet((
+    _rule(0, [90, 100, 115, 126], [-0.05, 0.08, 0.22, 0.35, 0.55], (
+        "",
+        "Glucose {} mg/dL - acceptable but monitor",
+        "⚠️  Glucose {} mg/dL - impaired fasting glucose (IFG)",
+        "🟠 Glucose {} mg/dL - high pre-diabetic range",
+        "🔴 Glucose {} mg/dL meets diabetes diagnostic criteria (≥126)",
+    ), mult=[1.0, 1.0, 1.1, 1.25, 1.4]),
+    _rule(1, [23, 25, 27, 30, 35], [-0.03, 0.0, 0.06, 0.12, 0.18, 0.25], (
+        "",
+        "",
+        "Overweight (BMI {:.1f}) - mild risk",
+        "Overweight (BMI {:.1f}) - moderate risk factor",
+        "Obesity (BMI {:.1f}) - increased diabetes risk",
+        "Severe obesity (BMI {:.1f}) - very high diabetes risk",
+    ), mult=[1.0, 1.0, 1.0, 1.0, 1.15, 1.3]),
+    _rule(2, [45, 55, 65], [0.0, 0.07, 0.11, 0.15], (
+        "",
+        "Age {} - increased diabetes screening recommended",
+        "Age {} - elevated diabetes risk",
+        "Age {} - significantly increased diabetes prevalence",
+    ), mult=[1.0, 1.0, 1.0, 1.15]),
+    _rule(3, [85, 95], [0.0, 0.06, 0.12], (
+        "",
+        "Borderline BP ({} mmHg) - watch metabolic health",
+        "Elevated BP ({} mmHg) - metabolic syndrome indicator",
+    ), mult=[1.0, 1.0, 1.08]),
+), (float, float, int, int))
+
+_DIABETES_OUTCOMES = _build_outcomes(
+    _DIABETES_RULES, "probability", (0.82, 0.28, 0.97), [0.20, 0.35, 0.50, 0.70], (
+        ("Low Risk", "Continue healthy habits. Screen every 3 years if no risk factors.", GREEN),
+        ("Moderate Risk", "Annual screening recommended. Focus on weight management and physical activity.", ORANGE),
+        ("Pre-Diabetic Range", "See doctor within 2 weeks. Start lifestyle changes: lose 5-7% body weight, exercise 150min/week.", ORANGE),
+        ("High Risk - Probable Diabetes", "Schedule urgent appointment for fasting glucose and HbA1c testing. Likely requires medication.", RED),
+        ("Diabetes Highly Likely", "🔴 URGENT: See doctor immediately for HbA1c test and diabetes management. Start blood sugar monitoring.", RED),
+    ),
+    {"model_name": "diabetes", "model_version": "v1.1_ada_enhanced", "glucose_level": None, "bmi_category": None}
+)
+
+_BMI_BINS = (18.5, 25, 30, 35)
+_BMI_LABELS = ("Underweight", "Normal", "Overweight", "Obese Class I", "Obese Class II+")
+
+# Liver rules are applied bilirubin, ALT, AST, ALP like the scalar path
+_LIVER_RULES = _RuleSet((
+    _rule(1, [1.2, 2.0], [0.0, 0.18, 0.35], (
+        "",
+        "Borderline bilirubin ({} mg/dL)",
+        "Elevated bilirubin ({} mg/dL) - liver dysfunction indicator",
+    )),
+    _rule(3, [60, 100], [0.0, 0.20, 0.30], (
+        "",
+        "Elevated ALT ({} U/L) - liver inflammation",
+        "Very high ALT ({} U/L) - significant liver damage",
+    )),
+    _rule(4, [60, 100], [0.0, 0.15, 0.25], (
+        "",
+        "Elevated AST ({} U/L)",
+        "Very high AST ({} U/L)",
+    )),
+    _rule(2, [150], [0.0, 0.15], (
+        "",
+        "High ALP ({} U/L) - possible cholestasis",
+    )),
+), (int, float, int, int, int))
+
+_LIVER_OUTCOMES = _build_outcomes(
+    _LIVER_RULES, "risk_score", (0.85, 0.22, None), [0.15, 0.35, 0.60], (
+        ("Normal Liver Function", "Liver enzymes within healthy range. Continue healthy habits.", GREEN),
+        ("Mild Elevation", "Monitor liver enzymes. Lifestyle modifications recommended.", ORANGE),
+        ("Moderate Risk - Abnormal Liver Function", "See doctor within 1 week. Repeat liver function tests. Avoid alcohol.", ORANGE),
+        ("High Risk - Liver Disease Likely", "🔴 URGENT: Consult hepatologist. Further testing (ultrasound, fibroscan) required.", RED),
+    ),
+    {"model_name": "liver_disease", "model_version": "v1.0_enhanced"}
+)
+
+# Breast cancer rules only score; there is no list of factors
+_BREAST_RULES = _RuleSet((
+    _rule(0, [20, 25], [0.0, 0.12, 0.25]),
+    _rule(1, [100, 120], [0.0, 0.18, 0.30]),
+    _rule(2, [700, 900], [0.0, 0.15, 0.28]),
+    _rule(3, [0.12, 0.20], [0.0, 0.10, 0.22]),
+), (float, float, float, float))
+
+_BREAST_OUTCOMES = _build_outcomes(
+    _BREAST_RULES, "malignancy_score", (0.88, 0.18, None), [0.35, 0.60], (
+        ("Benign", "Likely benign. Regular monitoring recommended. Follow-up in 6 months.", GREEN),
+        ("Suspicious", "Concerning features detected. Schedule biopsy and further testing within 1 week.", ORANGE),
+        ("Malignant", "⚠️ URGENT: High likelihood of malignancy. Immediate oncologist consultation and biopsy required.", RED),
+    ),
+    {"model_name": "breast_cancer", "model_version": "v1.0_wisconsin"},
+    factors_key=None
+)
+
+# Lower HNR is worse, so its buckets are closed on the right (hnr <= 18, <= 21)
+_PARKINSONS_RULES = _RuleSet((
+    _rule(0, [0.007, 0.010], [0.0, 0.15, 0.30], (
+        "",
+        "Elevated jitter ({:.4f})",
+        "High voice jitter ({:.4f}) - vocal instability detected",
+    )),
+    _rule(1, [0.05, 0.08], [0.0, 0.12, 0.28], (
+        "",
+        "Elevated shimmer ({:.3f})",
+        "High shimmer ({:.3f}) - amplitude variation",
+    )),
+    _rule(2, [0.03, 0.05], [0.0, 0.10, 0.25], (
+        "",
+        "Elevated NHR ({:.3f})",
+        "High NHR ({:.3f}) - increased breathiness",
+    )),
+    _rule(3, [18, 21], [0.20, 0.08, 0.0], (
+        "Low HNR ({:.1f} dB) - reduced voice quality",
+        "Borderline HNR ({:.1f} dB)",
+        "",
+    ), right=True),
+), (float, float, float, float))
+
+_PARKINSONS_OUTCOMES = _build_outcomes(
+    _PARKINSONS_RULES, "parkinsons_score", (0.80, 0.28, None), [0.40, 0.65], (
+        ("No Parkinson's Detected", "Voice measurements within normal range. Continue regular health monitoring.", GREEN),
+        ("Parkinson's Possible", "Voice abnormalities detected. Neurological assessment recommended. Monitor symptoms.", ORANGE),
+        ("Parkinson's Likely", "⚠️ URGENT: Strong indicators of Parkinson's disease. Consult neurologist for clinical evaluation and DAT scan.", RED),
+    ),
+    {"model_name": "parkinsons", "model_version": "v1.0_voice"},
+    factors_key="indicators"
+)
+
+# Mock image classifiers: (prediction, recommendation, color, confidence range)
+# per class, drawn with the cumulative weights like random.choices would
+_BRAIN_CLASSES = (
+    ("No Tumor", "No tumor detected. Continue regular monitoring.", GREEN, (0.85, 0.95)),
+) + tuple(
+    (tumor, f"{tumor} detected. Immediate consultation with neurologist required.", RED, (0.75, 0.92))
+    for tumor in ("Glioma", "Meningioma", "Pituitary")
+)
+_BRAIN_CUM_WEIGHTS = tuple(accumulate((0.4, 0.3, 0.2, 0.1)))
+
+_KIDNEY_CONDITIONS = (
+    ("Normal", "No abnormalities detected. Continue regular health checkups.", GREEN, (0.82, 0.94)),
+    ("Kidney Cyst", "Benign cyst detected. Monitor with periodic ultrasounds. Usually no treatment needed.", ORANGE, (0.76, 0.89)),
+    ("Kidney Stone", "Kidney stone detected. Increase water intake (2-3L/day). Consult urologist if symptomatic.", ORANGE, (0.76, 0.89)),
+    ("Kidney Tumor", "⚠️ Tumor detected. URGENT: Immediate urologist consultation and further imaging required.", RED, (0.76, 0.89)),
+)
+_KIDNEY_CUM_WEIGHTS = tuple(accumulate((0.50, 0.25, 0.15, 0.10)))
+
+
+_array_module = None
+
+
+def _get_array_module():
+    """cupy when it is installed with a usable GPU, numpy otherwise (checked once)"""
+    global _array_module
+    if _array_module is None:
+        try:
+            import cupy
+            cupy.cuda.runtime.getDeviceCount()
+            _array_module = cupy
+        except Exception:
+            _array_module = np
+    return _array_module
+
+
+def _draw_classes(classes: tuple, cum_weights: tuple, n: int, seed: Optional[int]):
+    """Draw n class indices and confidences in one pass of a numpy Generator"""
+    rng = np.random.default_rng(seed)
+    idx = np.searchsorted(cum_weights, rng.random(n) * cum_weights[-1], side="right")
+    np.minimum(idx, len(classes) - 1, out=idx)
+    low, high = np.array([c[3] for c in classes]).T
+    confidence = low[idx] + (high - low)[idx] * rng.random(n)
+    return idx.tolist(), confidence.tolist()
+
+
+def predict_heart_disease(data: Dict[str, Any]) -> Mapping[str, Any]:
+    """Heart disease risk for a dict of HEART_FEATURES (read-only result)"""
+    return heart_disease_risk(
+        int(data.get('age', 50)),
+        int(data.get('chol', 200)),
+        int(data.get('trestbps', 120)),
+        int(data.get('cp', 0)),
+        int(data.get('fbs', 0))
+    )
+
+
+def heart_disease_risk(age: int, chol: int, trestbps: int, cp: int, fbs: int) -> Mapping[str, Any]:
+    """
+    Enhanced heart disease risk prediction based on clinical guidelines
+    Uses improved risk scoring similar to Framingham/ACC-AHA models
+    
+    Factors weighted by medical importance:
+    - age: Progressive risk increase
+    - cholesterol: LDL threshold-based
+    - blood pressure: Stage-based classification
+    - chest pain: Symptom severity indicator
+    - fasting blood sugar: Diabetes marker
+    
+    Thresholds, weights and messages are the _HEART_RULES tables
+    """
+    key, factors = _HEART_RULES.row((age, chol, trestbps, cp, fbs))
+    return _result(_HEART_OUTCOMES[key], risk_factors=factors or HEART_NO_RISK_FACTORS)
+
+
+def predict_diabetes(data: Dict[str, Any]) -> Mapping[str, Any]:
+    """Diabetes risk for a dict of DIABETES_FEATURES (read-only result)"""
+    return diabetes_risk(
+        float(data.get('glucose', 100)),
+        float(data.get('bmi', 25)),
+        int(data.get('age', 40)),
+        int(data.get('blood_pressure', 80))
+    )
+
+
+def diabetes_risk(glucose: float, bmi: float, age: int, bp: int) -> Mapping[str, Any]:
+    """
+    Enhanced diabetes risk prediction based on ADA guidelines
+    Uses HbA1c thresholds and metabolic syndrome criteria
+    
+    Factors weighted by diagnostic importance:
+    - glucose: Fasting plasma glucose (FPG) - primary diagnostic
+    - bmi: Obesity indicator - major risk factor
+    - age: Progressive risk
+    - blood_pressure: Metabolic syndrome component
+    
+    Thresholds, weights and messages are the _DIABETES_RULES tables
+    """
+    key, factors = _DIABETES_RULES.row((glucose, bmi, age, bp))
+    return _result(
+        _DIABETES_OUTCOMES[key],
+        risk_factors=factors or DIABETES_NO_RISK_FACTORS,
+        glucose_level=glucose,
+        bmi_category=_BMI_LABELS[bisect_right(_BMI_BINS, bmi)]
+    )
+
+
+def predict_heart_disease_batch(rows) -> List[Mapping[str, Any]]:
+    """Score a (batch, len(HEART_FEATURES)) array, one result per row"""
+    return [
+        _result(_HEART_OUTCOMES[key], risk_factors=factors or HEART_NO_RISK_FACTORS)
+        for _, key, factors in _HEART_RULES.rows(rows)
+    ]
+
+
+def predict_diabetes_batch(rows) -> List[Mapping[str, Any]]:
+    """Score a (batch, len(DIABETES_FEATURES)) array, one result per row"""
+    rows = np.asarray(rows, dtype=np.float64)
+    categories = np.digitize(rows[:, 1], _BMI_BINS).tolist()
+    results = []
+    for ((glucose, _, _, _), key, factors), category in zip(_DIABETES_RULES.rows(rows), categories):
+        results.append(_result(
+            _DIABETES_OUTCOMES[key],
+            risk_factors=factors or DIABETES_NO_RISK_FACTORS,
+            glucose_level=glucose,
+            bmi_category=_BMI_LABELS[category]
+        ))
+    return results
+
+
+def heart_disease_scores(rows) -> np.ndarray:
+    """
+    Risk scores only for a (cohort, len(HEART_FEATURES)) array
+    Bucketing and the score gather run on the GPU when cupy is available
+    """
+    xp = _get_array_module()
+    _, buckets = _HEART_RULES.buckets(rows, xp)
+    scores = xp.asarray(_HEART_RISK_SCORES)[xp.ravel_multi_index(buckets, _HEART_RULES.shape)]
+    return scores if xp is np else xp.asnumpy(scores)
+
+
+def predict_liver_disease_batch(rows) -> List[Mapping[str, Any]]:
+    """Score a (batch, len(LIVER_FEATURES)) array, one result per row"""
+    return [
+        _result(_LIVER_OUTCOMES[key], risk_factors=factors or LIVER_NO_RISK_FACTORS)
+        for _, key, factors in _LIVER_RULES.rows(rows)
+    ]
+
+
+def predict_brain_tumor(image_data: bytes = None) -> Dict[str, Any]:
+    """
+    Brain tumor classification (mock - image analysis)
+    In real implementation, would use CNN model
+    """
+    # Mock classification: one uniform draw against the cumulative weights
+    i = bisect_right(_BRAIN_CUM_WEIGHTS, random.random() * _BRAIN_CUM_WEIGHTS[-1], 0, len(_BRAIN_CLASSES) - 1)
+    prediction, recommendation, color, (low, high) = _BRAIN_CLASSES[i]
+    confidence = low + (high - low) * random.random()
     
-    @staticmethod
-    def predict_brain_tumor(image_data: bytes = None) -> Dict[str, Any]:
-        """
-        Brain tumor classification (mock - image analysis)
-        In real implementation, would use CNN model
-        """
-        # Mock classification
-        tumor_types = ["No Tumor", "Glioma", "Meningioma", "Pituitary"]
-        weights = [0.4, 0.3, 0.2, 0.1]  # Probability distribution
-        
-        prediction = random.choices(tumor_types, weights=weights)[0]
-        
-        if prediction == "No Tumor":
-            confidence = random.uniform(0.85, 0.95)
-            recommendation = "No tumor detected. Continue regular monitoring."
-            color = "green"
-        else:
-            confidence = random.uniform(0.75, 0.92)
-            recommendation = f"{prediction} detected. Immediate consultation with neurologist required."
-            color = "red"
-        
-        return {
+    return {
+        "prediction": prediction,
+        "confidence": round(confidence, 2),
+        "tumor_type": prediction,
+        "recommendation": recommendation,
+        "color": color,
+        "model_name": "brain_tumor",
+        "model_version": "v1_mock",
+        "scan_quality": "Good"
+    }
+
+
+def predict_brain_tumor_batch(n: int, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """n mock brain scan results drawn at once (pass seed for reproducible runs)"""
+    idx, confidences = _draw_classes(_BRAIN_CLASSES, _BRAIN_CUM_WEIGHTS, n, seed)
+    results = []
+    for i, confidence in zip(idx, confidences):
+        prediction, recommendation, color, _ = _BRAIN_CLASSES[i]
+        results.append({
             "prediction": prediction,
             "confidence": round(confidence, 2),
             "tumor_type": prediction,
@@ -312,260 +566,142 @@ class MockPredictionEngine:
             "model_name": "brain_tumor",
             "model_version": "v1_mock",
             "scan_quality": "Good"
-        }
+        })
+    return results
+
+
+def predict_kidney_disease(data: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Kidney disease detection (simplified - mock for CT scan analysis)
+    In real implementation would analyze CT scan images
+    """
+    # For demo, weighted random selection over _KIDNEY_CONDITIONS
+    i = bisect_right(_KIDNEY_CUM_WEIGHTS, random.random() * _KIDNEY_CUM_WEIGHTS[-1], 0, len(_KIDNEY_CONDITIONS) - 1)
+    name, recommendation, color, (low, high) = _KIDNEY_CONDITIONS[i]
+    confidence = low + (high - low) * random.random()
     
-    @staticmethod
-    def predict_kidney_disease(data: Dict[str, Any] = None) -> Dict[str, Any]:
-        """
-        Kidney disease detection (simplified - mock for CT scan analysis)
-        In real implementation would analyze CT scan images
-        """
-        # For demo, use simple probability
-        conditions = [
-            {"name": "Normal", "prob": 0.50, "color": "green", "rec": "No abnormalities detected. Continue regular health checkups."},
-            {"name": "Kidney Cyst", "prob": 0.25, "color": "orange", "rec": "Benign cyst detected. Monitor with periodic ultrasounds. Usually no treatment needed."},
-            {"name": "Kidney Stone", "prob": 0.15, "color": "orange", "rec": "Kidney stone detected. Increase water intake (2-3L/day). Consult urologist if symptomatic."},
-            {"name": "Kidney Tumor", "prob": 0.10, "color": "red", "rec": "⚠️ Tumor detected. URGENT: Immediate urologist consultation and further imaging required."}
-        ]
-        
-        # Weighted random selection
-        result = random.choices(conditions, weights=[c["prob"] for c in conditions])[0]
-        confidence = random.uniform(0.82, 0.94) if result["name"] == "Normal" else random.uniform(0.76, 0.89)
-        
-        return {
-            "prediction": result["name"],
-            "condition": result["name"],
+    return {
+        "prediction": name,
+        "condition": name,
+        "confidence": round(confidence, 3),
+        "recommendation": recommendation,
+        "color": color,
+        "model_name": "kidney_disease",
+        "model_version": "v1.0_mock",
+        "scan_quality": "Good"
+    }
+
+
+def predict_kidney_disease_batch(n: int, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """n mock kidney scan results drawn at once (pass seed for reproducible runs)"""
+    idx, confidences = _draw_classes(_KIDNEY_CONDITIONS, _KIDNEY_CUM_WEIGHTS, n, seed)
+    results = []
+    for i, confidence in zip(idx, confidences):
+        name, recommendation, color, _ = _KIDNEY_CONDITIONS[i]
+        results.append({
+            "prediction": name,
+            "condition": name,
             "confidence": round(confidence, 3),
-            "recommendation": result["rec"],
-            "color": result["color"],
+            "recommendation": recommendation,
+            "color": color,
             "model_name": "kidney_disease",
             "model_version": "v1.0_mock",
             "scan_quality": "Good"
-        }
+        })
+    return results
+
+
+def predict_liver_disease(data: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Liver disease screening based on lab values
+    Uses liver enzyme levels and protein markers (see _LIVER_RULES)
+    """
+    age = int(data.get('age', 40))
+    total_bilirubin = float(data.get('total_bilirubin', 0.7))
+    alkaline_phosphotase = int(data.get('alkaline_phosphotase', 70))
+    alamine_aminotransferase = int(data.get('alamine_aminotransferase', 25))  # ALT
+    aspartate_aminotransferase = int(data.get('aspartate_aminotransferase', 25))  # AST
     
-    @staticmethod
-    def predict_liver_disease(data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Liver disease screening based on lab values
-        Uses liver enzyme levels and protein markers
-        """
-        age = int(data.get('age', 40))
-        total_bilirubin = float(data.get('total_bilirubin', 0.7))
-        alkaline_phosphotase = int(data.get('alkaline_phosphotase', 70))
-        alamine_aminotransferase = int(data.get('alamine_aminotransferase', 25))  # ALT
-        aspartate_aminotransferase = int(data.get('aspartate_aminotransferase', 25))  # AST
-        
-        risk_score = 0.0
-        factors = []
-        
-        # Bilirubin (elevated indicates liver dysfunction)
-        if total_bilirubin >= 2.0:
-            risk_score += 0.35
-            factors.append(f"Elevated bilirubin ({total_bilirubin} mg/dL) - liver dysfunction indicator")
-        elif total_bilirubin >= 1.2:
-            risk_score += 0.18
-            factors.append(f"Borderline bilirubin ({total_bilirubin} mg/dL)")
-        
-        # ALT (liver-specific enzyme)
-        if alamine_aminotransferase >= 100:
-            risk_score += 0.30
-            factors.append(f"Very high ALT ({alamine_aminotransferase} U/L) - significant liver damage")
-        elif alamine_aminotransferase >= 60:
-            risk_score += 0.20
-            factors.append(f"Elevated ALT ({alamine_aminotransferase} U/L) - liver inflammation")
-        
-        # AST 
-        if aspartate_aminotransferase >= 100:
-            risk_score += 0.25
-            factors.append(f"Very high AST ({aspartate_aminotransferase} U/L)")
-        elif aspartate_aminotransferase >= 60:
-            risk_score += 0.15
-            factors.append(f"Elevated AST ({aspartate_aminotransferase} U/L)")
-        
-        # Alkaline Phosphatase
-        if alkaline_phosphotase >= 150:
-            risk_score += 0.15
-            factors.append(f"High ALP ({alkaline_phosphotase} U/L) - possible cholestasis")
-        
-        risk_score = min(risk_score, 1.0)
-        
-        # Classification
-        if risk_score >= 0.60:
-            prediction = "High Risk - Liver Disease Likely"
-            recommendation = "🔴 URGENT: Consult hepatologist. Further testing (ultrasound, fibroscan) required."
-            color = "red"
-        elif risk_score >= 0.35:
-            prediction = "Moderate Risk - Abnormal Liver Function"
-            recommendation = "See doctor within 1 week. Repeat liver function tests. Avoid alcohol."
-            color = "orange"
-        elif risk_score >= 0.15:
-            prediction = "Mild Elevation"
-            recommendation = "Monitor liver enzymes. Lifestyle modifications recommended."
-            color = "orange"
-        else:
-            prediction = "Normal Liver Function"
-            recommendation = "Liver enzymes within healthy range. Continue healthy habits."
-            color = "green"
-        
-        confidence = 0.85 + (abs(risk_score - 0.5) * 0.22)
-        
-        if not factors:
-            factors.append("All liver markers within normal range")
-        
-        return {
-            "prediction": prediction,
-            "risk_score": round(risk_score, 3),
-            "confidence": round(confidence, 3),
-            "risk_factors": factors,
-            "recommendation": recommendation,
-            "color": color,
-            "model_name": "liver_disease",
-            "model_version": "v1.0_enhanced"
-        }
+    return liver_disease_risk(
+        age, total_bilirubin, alkaline_phosphotase,
+        alamine_aminotransferase, aspartate_aminotransferase
+    )
+
+
+@lru_cache(maxsize=_LAB_RESULT_CACHE_SIZE)
+def liver_disease_risk(age: int, total_bilirubin: float, alkaline_phosphotase: int,
+                       alamine_aminotransferase: int, aspartate_aminotransferase: int) -> Mapping[str, Any]:
+    """Cached liver scoring on positional LIVER_FEATURES values"""
+    key, factors = _LIVER_RULES.row((
+        age, total_bilirubin, alkaline_phosphotase,
+        alamine_aminotransferase, aspartate_aminotransferase
+    ))
+    return _result(_LIVER_OUTCOMES[key], risk_factors=factors or LIVER_NO_RISK_FACTORS)
+
+
+def predict_breast_cancer(data: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Breast cancer classification based on cell nucleus measurements
+    Simplified version of Wisconsin Breast Cancer dataset features (see _BREAST_RULES)
+    """
+    # Using subset of features for simplicity
+    texture_mean = float(data.get('texture_mean', 15))
+    perimeter_mean = float(data.get('perimeter_mean', 80))
+    area_mean = float(data.get('area_mean', 500))
+    concavity_mean = float(data.get('concavity_mean', 0.1))
     
-    @staticmethod
-    def predict_breast_cancer(data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Breast cancer classification based on cell nucleus measurements
-        Simplified version of Wisconsin Breast Cancer dataset features
-        """
-        # Using subset of features for simplicity
-        texture_mean = float(data.get('texture_mean', 15))
-        perimeter_mean = float(data.get('perimeter_mean', 80))
-        area_mean = float(data.get('area_mean', 500))
-        concavity_mean = float(data.get('concavity_mean', 0.1))
-        
-        malignancy_score = 0.0
-        
-        # Texture (roughness of nucleus)
-        if texture_mean >= 25:
-            malignancy_score += 0.25
-        elif texture_mean >= 20:
-            malignancy_score += 0.12
-        
-        # Perimeter (larger = more concerning)
-        if perimeter_mean >= 120:
-            malignancy_score += 0.30
-        elif perimeter_mean >= 100:
-            malignancy_score += 0.18
-        
-        # Area
-        if area_mean >= 900:
-            malignancy_score += 0.28
-        elif area_mean >= 700:
-            malignancy_score += 0.15
-        
-        # Concavity (indentations)
-        if concavity_mean >= 0.20:
-            malignancy_score += 0.22
-        elif concavity_mean >= 0.12:
-            malignancy_score += 0.10
-        
-        malignancy_score = min(malignancy_score, 1.0)
-        
-        # Classification
-        if malignancy_score >= 0.60:
-            prediction = "Malignant"
-            recommendation = "⚠️ URGENT: High likelihood of malignancy. Immediate oncologist consultation and biopsy required."
-            color = "red"
-        elif malignancy_score >= 0.35:
-            prediction = "Suspicious"
-            recommendation = "Concerning features detected. Schedule biopsy and further testing within 1 week."
-            color = "orange"
-        else:
-            prediction = "Benign"
-            recommendation = "Likely benign. Regular monitoring recommended. Follow-up in 6 months."
-            color = "green"
-        
-        confidence = 0.88 + (abs(malignancy_score - 0.5) * 0.18)
-        
-        return {
-            "prediction": prediction,
-            "malignancy_score": round(malignancy_score, 3),
-            "confidence": round(confidence, 3),
-            "recommendation": recommendation,
-            "color": color,
-            "model_name": "breast_cancer",
-            "model_version": "v1.0_wisconsin"
-        }
+    return breast_cancer_risk(texture_mean, perimeter_mean, area_mean, concavity_mean)
+
+
+@lru_cache(maxsize=_LAB_RESULT_CACHE_SIZE)
+def breast_cancer_risk(texture_mean: float, perimeter_mean: float, area_mean: float,
+                       concavity_mean: float) -> Mapping[str, Any]:
+    """Cached breast cancer scoring on positional feature values"""
+    key, _ = _BREAST_RULES.row((texture_mean, perimeter_mean, area_mean, concavity_mean))
+    return _result(_BREAST_OUTCOMES[key])
+
+
+def predict_parkinsons(data: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Parkinson's disease detection from voice measurements
+    Based on dysphonia features (jitter, shimmer, etc., see _PARKINSONS_RULES)
+    """
+    jitter = float(data.get('mdvp_jitter', 0.005))  # Frequency variation
+    shimmer = float(data.get('shimmer', 0.03))  # Amplitude variation
+    nhr = float(data.get('nhr', 0.02))  # Noise-to-harmonics ratio
+    hnr = float(data.get('hnr', 22))  # Harmonics-to-noise ratio
     
-    @staticmethod
-    def predict_parkinsons(data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Parkinson's disease detection from voice measurements
-        Based on dysphonia features (jitter, shimmer, etc.)
-        """
-        jitter = float(data.get('mdvp_jitter', 0.005))  # Frequency variation
-        shimmer = float(data.get('shimmer', 0.03))  # Amplitude variation
-        nhr = float(data.get('nhr', 0.02))  # Noise-to-harmonics ratio
-        hnr = float(data.get('hnr', 22))  # Harmonics-to-noise ratio
-        
-        parkinsons_score = 0.0
-        indicators = []
-        
-        # Jitter (higher = more vocal instability, PD indicator)
-        if jitter >= 0.010:
-            parkinsons_score += 0.30
-            indicators.append(f"High voice jitter ({jitter:.4f}) - vocal instability detected")
-        elif jitter >= 0.007:
-            parkinsons_score += 0.15
-            indicators.append(f"Elevated jitter ({jitter:.4f})")
-        
-        # Shimmer (amplitude variation)
-        if shimmer >= 0.08:
-            parkinsons_score += 0.28
-            indicators.append(f"High shimmer ({shimmer:.3f}) - amplitude variation")
-        elif shimmer >= 0.05:
-            parkinsons_score += 0.12
-            indicators.append(f"Elevated shimmer ({shimmer:.3f})")
-        
-        # NHR (noise to harmonics)
-        if nhr >= 0.05:
-            parkinsons_score += 0.25
-            indicators.append(f"High NHR ({nhr:.3f}) - increased breathiness")
-        elif nhr >= 0.03:
-            parkinsons_score += 0.10
-            indicators.append(f"Elevated NHR ({nhr:.3f})")
-        
-        # HNR (lower = more noise, PD indicator)
-        if hnr <= 18:
-            parkinsons_score += 0.20
-            indicators.append(f"Low HNR ({hnr:.1f} dB) - reduced voice quality")
-        elif hnr <= 21:
-            parkinsons_score += 0.08
-            indicators.append(f"Borderline HNR ({hnr:.1f} dB)")
-        
-        parkinsons_score = min(parkinsons_score, 1.0)
-        
-        # Classification
-        if parkinsons_score >= 0.65:
-            prediction = "Parkinson's Likely"
-            recommendation = "⚠️ URGENT: Strong indicators of Parkinson's disease. Consult neurologist for clinical evaluation and DAT scan."
-            color = "red"
-        elif parkinsons_score >= 0.40:
-            prediction = "Parkinson's Possible"
-            recommendation = "Voice abnormalities detected. Neurological assessment recommended. Monitor symptoms."
-            color = "orange"
-        else:
-            prediction = "No Parkinson's Detected"
-            recommendation = "Voice measurements within normal range. Continue regular health monitoring."
-            color = "green"
-        
-        confidence = 0.80 + (abs(parkinsons_score - 0.5) * 0.28)
-        
-        if not indicators:
-            indicators.append("All voice measurements within healthy parameters")
-        
-        return {
-            "prediction": prediction,
-            "parkinsons_score": round(parkinsons_score, 3),
-            "confidence": round(confidence, 3),
-            "indicators": indicators,
-            "recommendation": recommendation,
-            "color": color,
-            "model_name": "parkinsons",
-            "model_version": "v1.0_voice"
-        }
+    return parkinsons_risk(jitter, shimmer, nhr, hnr)
+
+
+@lru_cache(maxsize=_LAB_RESULT_CACHE_SIZE)
+def parkinsons_risk(jitter: float, shimmer: float, nhr: float, hnr: float) -> Mapping[str, Any]:
+    """Cached Parkinson's scoring on positional voice measurements"""
+    key, indicators = _PARKINSONS_RULES.row((jitter, shimmer, nhr, hnr))
+    return _result(_PARKINSONS_OUTCOMES[key], indicators=indicators or PARKINSONS_NO_INDICATORS)
+
+
+class MockPredictionEngine:
+    """Intelligent mock predictions based on medical logic (namespace over the module functions)"""
+
+    predict_heart_disease = staticmethod(predict_heart_disease)
+    heart_disease_risk = staticmethod(heart_disease_risk)
+    predict_diabetes = staticmethod(predict_diabetes)
+    diabetes_risk = staticmethod(diabetes_risk)
+    predict_heart_disease_batch = staticmethod(predict_heart_disease_batch)
+    predict_diabetes_batch = staticmethod(predict_diabetes_batch)
+    predict_liver_disease_batch = staticmethod(predict_liver_disease_batch)
+    heart_disease_scores = staticmethod(heart_disease_scores)
+    predict_brain_tumor = staticmethod(predict_brain_tumor)
+    predict_brain_tumor_batch = staticmethod(predict_brain_tumor_batch)
+    predict_kidney_disease = staticmethod(predict_kidney_disease)
+    predict_kidney_disease_batch = staticmethod(predict_kidney_disease_batch)
+    predict_liver_disease = staticmethod(predict_liver_disease)
+    liver_disease_risk = staticmethod(liver_disease_risk)
+    predict_breast_cancer = staticmethod(predict_breast_cancer)
+    breast_cancer_risk = staticmethod(breast_cancer_risk)
+    predict_parkinsons = staticmethod(predict_parkinsons)
+    parkinsons_risk = staticmethod(parkinsons_risk)
 
 
 # Singleton instance
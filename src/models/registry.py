@@ -3,14 +3,65 @@ Model version registry and management
 Handles model versioning, rollback, and metadata tracking
 """
 
-import json
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, FrozenSet, Optional, List, Tuple
 from datetime import datetime
+import orjson
 from config.settings import get_settings
 from src.monitoring.logger import logger
 
+# Model file extension by model type (anything else is a pickle)
+_MODEL_EXTENSIONS = {
+    "brain_tumor": ".h5",
+    "kidney": ".h5",
+    "liver": ".pkl",
+    "heart": ".pkl",
+    "diabetes": ".pkl",
+    "breast_cancer": ".pkl",
+    "parkinsons": ".pkl"
+}
+
+
+@lru_cache(maxsize=256)
+def _model_file(models_dir: Path, version: str, model_name: str, suffix: str) -> Path:
+    """models_dir/version/<model_name><suffix>, built once per combination (paths are immutable)"""
+    return models_dir / version / f"{model_name}{suffix}"
+
+
+def _file_signature(path: Path) -> Tuple[int, int, int]:
+    """
+    (mtime, inode, size) of a file
+    Writes replace the file, so the inode changes even when two writes land
+    on the same coarse mtime tick
+    """
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_ino, st.st_size)
+
+
+def _read_json(path: Path) -> Dict:
+    """Load a JSON file (a fresh parse, so callers may mutate the result)"""
+    return orjson.loads(path.read_bytes())
+
+
+def _write_json(path: Path, data: Dict):
+    """
+    Write a JSON file
+    The data goes to a temp file in the same directory that then replaces the
+    target, so readers (and a crash mid-write) never see a partial file
+    """
+    # Unique per process and thread; created like open() would (umask applies)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'xb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 class ModelRegistry:
     """
@@ -20,21 +71,27 @@ class ModelRegistry:
     
     def __init__(self, models_dir: str = None):
         settings = get_settings()
+        # MODEL_VERSION pins every model to one version when set (v1 = use the registry)
+        self._env_model_version = settings.model_version
         self.models_dir = Path(models_dir or settings.models_dir)
         self.active_versions_file = self.models_dir / "active_versions.json"
         self._active_versions: Dict[str, str] = {}
+        # Signature of active_versions.json when _active_versions was read
+        self._active_versions_signature: Optional[Tuple[int, int, int]] = None
         self._model_metadata: Dict[str, Dict] = {}
+        # (mtimes of models_dir and each version dir, {version: file names})
+        self._versions_cache: Optional[Tuple[tuple, Dict[str, FrozenSet[str]]]] = None
         self._load_active_versions()
     
     def _load_active_versions(self):
         """Load active version configuration"""
         if self.active_versions_file.exists():
             try:
-                with open(self.active_versions_file, 'r') as f:
-                    self._active_versions = json.load(f)
-                logger.info(f"Loaded active versions: {self._active_versions}")
+                self._active_versions_signature = _file_signature(self.active_versions_file)
+                self._active_versions = _read_json(self.active_versions_file)
+                logger.info("Loaded active versions: %s", self._active_versions)
             except Exception as e:
-                logger.error(f"Failed to load active versions: {e}")
+                logger.error("Failed to load active versions: %s", e)
                 self._active_versions = {}
         else:
             # Initialize with v1 defaults
@@ -53,33 +110,49 @@ class ModelRegistry:
         """Save active version configuration"""
         try:
             self.models_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.active_versions_file, 'w') as f:
-                json.dump(self._active_versions, f, indent=2)
-            logger.info(f"Saved active versions: {self._active_versions}")
+            _write_json(self.active_versions_file, self._active_versions)
+            self._active_versions_signature = _file_signature(self.active_versions_file)
+            logger.info("Saved active versions: %s", self._active_versions)
+        except Exception as e:
+            logger.error("Failed to save active versions: %s", e)
+    
+    def _refresh_active_versions(self):
+        """Re-read active versions when another process has rewritten the file"""
+        try:
+            signature = _file_signature(self.active_versions_file)
+        except OSError:
+            return
+        if signature == self._active_versions_signature:
+            return
+        try:
+            self._active_versions = _read_json(self.active_versions_file)
+            self._active_versions_signature = signature
         except Exception as e:
-            logger.error(f"Failed to save active versions: {e}")
+            logger.error("Failed to reload active versions: %s", e)
     
     def get_active_version(self, model_name: str) -> str:
         """Get active version for a model"""
         # Check environment variable override
-        settings = get_settings()
-        env_version = settings.model_version
+        env_version = self._env_model_version
         
         # If env variable is set and not default, use it
         if env_version and env_version != "v1":
             return env_version
         
         # Otherwise use registry
+        self._refresh_active_versions()
         return self._active_versions.get(model_name, "v1")
     
     def set_active_version(self, model_name: str, version: str):
         """Set active version for a model"""
+        # Start from the latest file so switches made elsewhere are kept
+        self._refresh_active_versions()
         old_version = self._active_versions.get(model_name)
         self._active_versions[model_name] = version
         self._save_active_versions()
         
         logger.info(
-            f"Version switch for {model_name}: {old_version} -> {version}",
+            "Version switch for %s: %s -> %s", model_name, old_version, version,
             extra={"model_name": model_name}
         )
     
@@ -88,41 +161,31 @@ class ModelRegistry:
         if version is None:
             version = self.get_active_version(model_name)
         
-        # Determine file extension based on model type
-        extension_map = {
-            "brain_tumor": ".h5",
-            "kidney": ".h5",
-            "liver": ".pkl",
-            "heart": ".pkl",
-            "diabetes": ".pkl",
-            "breast_cancer": ".pkl",
-            "parkinsons": ".pkl"
-        }
-        
-        extension = extension_map.get(model_name, ".pkl")
-        model_path = self.models_dir / version / f"{model_name}{extension}"
-        
-        return model_path
+        extension = _MODEL_EXTENSIONS.get(model_name, ".pkl")
+        return _model_file(self.models_dir, version, model_name, extension)
     
     def get_metadata_path(self, model_name: str, version: str = None) -> Path:
         """Get path to model metadata file"""
         if version is None:
             version = self.get_active_version(model_name)
         
-        return self.models_dir / version / f"{model_name}_metadata.json"
+        return _model_file(self.models_dir, version, model_name, "_metadata.json")
     
     def load_metadata(self, model_name: str, version: str = None) -> Dict:
         """Load model metadata"""
         metadata_path = self.get_metadata_path(model_name, version)
         
-        if metadata_path.exists():
-            try:
-                with open(metadata_path, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Failed to load metadata for {model_name}: {e}")
+        try:
+            return _read_json(metadata_path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Failed to load metadata for %s: %s", model_name, e)
         
-        # Return default metadata if file doesn't exist
+        return self._default_metadata(model_name, version)
+    
+    def _default_metadata(self, model_name: str, version: str = None) -> Dict:
+        """Metadata reported for a model version without a metadata file"""
         return {
             "name": model_name,
             "version": version or self.get_active_version(model_name),
@@ -137,26 +200,47 @@ class ModelRegistry:
         metadata_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
-            logger.info(f"Saved metadata for {model_name}")
+            _write_json(metadata_path, metadata)
+            logger.info("Saved metadata for %s", model_name)
         except Exception as e:
-            logger.error(f"Failed to save metadata for {model_name}: {e}")
+            logger.error("Failed to save metadata for %s: %s", model_name, e)
     
-    def get_available_versions(self, model_name: str) -> List[str]:
-        """Get all available versions for a model"""
-        versions = []
+    def _version_listing(self) -> Dict[str, FrozenSet[str]]:
+        """
+        File names in each version directory, shared by every model
+        Rescanned only when models_dir or one of the version dirs changes mtime
+        """
+        try:
+            root_mtime = os.stat(self.models_dir).st_mtime_ns
+        except OSError:
+            return {}
         
-        if not self.models_dir.exists():
-            return versions
+        if self._versions_cache is not None:
+            signature, listing = self._versions_cache
+            try:
+                current = (root_mtime,) + tuple(
+                    os.stat(self.models_dir / version).st_mtime_ns for version in listing
+                )
+            except OSError:
+                current = None
+            if current == signature:
+                return listing
         
-        for version_dir in self.models_dir.iterdir():
+        listing = {}
+        mtimes = [root_mtime]
+        for version_dir in sorted(self.models_dir.iterdir()):
             if version_dir.is_dir() and version_dir.name.startswith('v'):
-                model_path = self.get_model_path(model_name, version_dir.name)
-                if model_path.exists():
-                    versions.append(version_dir.name)
-        
-        return sorted(versions)
+                mtimes.append(os.stat(version_dir).st_mtime_ns)
+                listing[version_dir.name] = frozenset(os.listdir(version_dir))
+        self._versions_cache = (tuple(mtimes), listing)
+        return listing
+    
+    def get_available_versions(self, model_name: str, listing: Dict[str, FrozenSet[str]] = None) -> List[str]:
+        """Get all available versions for a model"""
+        if listing is None:
+            listing = self._version_listing()
+        file_name = model_name + _MODEL_EXTENSIONS.get(model_name, ".pkl")
+        return [version for version, files in listing.items() if file_name in files]
     
     def rollback(self, model_name: str) -> Optional[str]:
         """
@@ -167,14 +251,14 @@ class ModelRegistry:
         current_version = self.get_active_version(model_name)
         
         if len(available_versions) < 2:
-            logger.warning(f"Cannot rollback {model_name}: insufficient versions")
+            logger.warning("Cannot rollback %s: insufficient versions", model_name)
             return None
         
         # Find current version index
         try:
             current_idx = available_versions.index(current_version)
         except ValueError:
-            logger.error(f"Current version {current_version} not found for {model_name}")
+            logger.error("Current version %s not found for %s", current_version, model_name)
             return None
         
         # Get previous version
@@ -185,24 +269,31 @@ class ModelRegistry:
             previous_version = available_versions[-1]
         
         self.set_active_version(model_name, previous_version)
-        logger.info(f"Rolled back {model_name} from {current_version} to {previous_version}")
+        logger.info("Rolled back %s from %s to %s", model_name, current_version, previous_version)
         
         return previous_version
     
     def list_all_models(self) -> List[Dict]:
         """List all registered models with their metadata"""
         models = []
+        listing = self._version_listing()
+        self._refresh_active_versions()
         
-        for model_name in self._active_versions.keys():
+        for model_name in list(self._active_versions):
             version = self.get_active_version(model_name)
-            metadata = self.load_metadata(model_name, version)
             model_path = self.get_model_path(model_name, version)
+            files = listing.get(version)
+            # The listing already says whether a metadata file exists
+            if files is not None and f"{model_name}_metadata.json" not in files:
+                metadata = self._default_metadata(model_name, version)
+            else:
+                metadata = self.load_metadata(model_name, version)
             
             models.append({
                 "name": model_name,
                 "active_version": version,
-                "available_versions": self.get_available_versions(model_name),
-                "loaded": model_path.exists(),
+                "available_versions": self.get_available_versions(model_name, listing),
+                "loaded": model_path.name in files if files is not None else model_path.exists(),
                 "metadata": metadata
             })
         
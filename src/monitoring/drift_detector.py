@@ -3,8 +3,10 @@ Data drift detection utilities
 Compares incoming data distributions with reference statistics
 """
 
-import json
+import math
+import os
 import numpy as np
+import orjson
 from typing import Dict, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
@@ -22,6 +24,8 @@ class DriftDetector:
         self.reference_stats_dir = Path(reference_stats_dir)
         self.reference_stats_dir.mkdir(parents=True, exist_ok=True)
         self.settings = get_settings()
+        # Parsed reference stats by model, with the file mtime they were read at
+        self._reference_cache: Dict[str, Tuple[int, Dict]] = {}
     
     def calculate_statistics(self, data: np.ndarray) -> Dict[str, float]:
         """
@@ -33,12 +37,31 @@ class DriftDetector:
         Returns:
             Dictionary of statistics
         """
+        # One float64 copy up front that every step below reuses in place,
+        # so the caller's array is untouched and nothing else is allocated
+        flat = np.array(data, dtype=np.float64).ravel()
+        n = flat.size
+        mean = flat.sum() / n
+        lowest, highest = flat.min(), flat.max()
+        flat -= mean
+        std = math.sqrt(np.dot(flat, flat) / n)
+        
+        # Selection instead of a full sort (the middle pair for even sizes);
+        # the shift by the mean keeps the order, so add it back afterwards
+        mid = n // 2
+        if n % 2:
+            flat.partition(mid)
+            median = flat[mid] + mean
+        else:
+            flat.partition((mid - 1, mid))
+            median = (flat[mid - 1] + flat[mid]) / 2 + mean
+        
         return {
-            "mean": float(np.mean(data)),
-            "std": float(np.std(data)),
-            "min": float(np.min(data)),
-            "max": float(np.max(data)),
-            "median": float(np.median(data))
+            "mean": float(mean),
+            "std": std,
+            "min": float(lowest),
+            "max": float(highest),
+            "median": float(median)
         }
     
     def save_reference_stats(self, model_name: str, data: np.ndarray):
@@ -55,10 +78,11 @@ class DriftDetector:
         
         stats_file = self.reference_stats_dir / f"{model_name}_stats.json"
         
-        with open(stats_file, 'w') as f:
-            json.dump(stats, f, indent=2)
+        with open(stats_file, 'wb') as f:
+            f.write(orjson.dumps(stats, option=orjson.OPT_INDENT_2))
+        self._reference_cache[model_name] = (os.stat(stats_file).st_mtime_ns, stats)
         
-        logger.info(f"Saved reference statistics for {model_name}")
+        logger.info("Saved reference statistics for %s", model_name)
     
     def load_reference_stats(self, model_name: str) -> Optional[Dict]:
         """
@@ -72,12 +96,18 @@ class DriftDetector:
         """
         stats_file = self.reference_stats_dir / f"{model_name}_stats.json"
         
-        if not stats_file.exists():
-            logger.warning(f"No reference statistics found for {model_name}")
+        try:
+            mtime = os.stat(stats_file).st_mtime_ns
+        except FileNotFoundError:
+            logger.warning("No reference statistics found for %s", model_name)
             return None
         
-        with open(stats_file, 'r') as f:
-            return json.load(f)
+        # Reparse only when the file changed (e.g. another worker updated it)
+        cached = self._reference_cache.get(model_name)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, orjson.loads(stats_file.read_bytes()))
+            self._reference_cache[model_name] = cached
+        return dict(cached[1])
     
     def detect_drift(
         self,
@@ -98,10 +128,19 @@ class DriftDetector:
         """
         threshold = threshold or self.settings.drift_threshold
         
+        # Too few samples for the statistics to mean anything
+        sample_size = len(current_data)
+        if sample_size < self.settings.drift_min_samples:
+            return False, {
+                "reason": "insufficient_samples",
+                "sample_size": sample_size,
+                "min_samples": self.settings.drift_min_samples
+            }
+        
         # Load reference statistics
         reference_stats = self.load_reference_stats(model_name)
         if reference_stats is None:
-            logger.warning(f"Cannot detect drift for {model_name}: no reference stats")
+            logger.warning("Cannot detect drift for %s: no reference stats", model_name)
             return False, {}
         
         # Calculate current statistics
@@ -134,12 +173,12 @@ class DriftDetector:
         
         if drift_detected:
             logger.warning(
-                f"Data drift detected for {model_name}: {overall_drift:.3f} > {threshold}",
+                "Data drift detected for %s: %.3f > %s", model_name, overall_drift, threshold,
                 extra={"model_name": model_name}
             )
         else:
             logger.info(
-                f"No drift detected for {model_name}: {overall_drift:.3f} <= {threshold}",
+                "No drift detected for %s: %.3f <= %s", model_name, overall_drift, threshold,
                 extra={"model_name": model_name}
             )
         
@@ -154,7 +193,7 @@ class DriftDetector:
             new_data: New reference dataset
         """
         self.save_reference_stats(model_name, new_data)
-        logger.info(f"Updated reference statistics for {model_name}")
+        logger.info("Updated reference statistics for %s", model_name)
 
 
 # Global drift detector instance
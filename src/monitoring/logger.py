@@ -5,9 +5,29 @@ Production-grade JSON logging with request tracking
 
 import logging
 import sys
-from datetime import datetime
+import time
 from typing import Any, Dict
-import json
+
+import orjson
+
+
+# Optional `extra=` fields copied into each log line
+_EXTRA_FIELDS = ("request_id", "model_name", "latency_ms", "confidence")
+_MISSING = object()
+
+# (epoch second, formatted UTC date/time) of the most recent record
+_timestamp_cache = (-1, "")
+
+
+def _utc_timestamp(created: float) -> str:
+    """ISO-8601 UTC time of a record's creation to the millisecond, date part formatted once per second"""
+    global _timestamp_cache
+    second = int(created)
+    cached_second, prefix = _timestamp_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _timestamp_cache = (second, prefix)
+    return f"{prefix}.{int((created - second) * 1000):03d}"
 
 
 class JSONFormatter(logging.Formatter):
@@ -15,30 +35,23 @@ class JSONFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
         
         # Add extra fields if present
-        if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
-        
-        if hasattr(record, "model_name"):
-            log_data["model_name"] = record.model_name
-            
-        if hasattr(record, "latency_ms"):
-            log_data["latency_ms"] = record.latency_ms
-            
-        if hasattr(record, "confidence"):
-            log_data["confidence"] = record.confidence
+        for field in _EXTRA_FIELDS:
+            value = getattr(record, field, _MISSING)
+            if value is not _MISSING:
+                log_data[field] = value
         
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_data)
+        return orjson.dumps(log_data).decode()
 
 
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
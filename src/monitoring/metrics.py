@@ -4,11 +4,15 @@ Tracks latency, prediction counts, and performance metrics
 """
 
 import time
-from typing import Dict, List
+from bisect import bisect_left, insort
+from typing import Deque, Dict, List
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
 from threading import Lock
 
+# Latency and confidence windows keep the last _WINDOW values per model
+_WINDOW = 1000
+
 
 class MetricsCollector:
     """
@@ -18,20 +22,25 @@ class MetricsCollector:
     
     def __init__(self):
         self._lock = Lock()
-        self._latencies: Dict[str, List[float]] = defaultdict(list)
+        self._latencies: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=_WINDOW))
+        # The same window kept in sorted order, so percentiles are direct indexes
+        self._sorted_latencies: Dict[str, List[float]] = defaultdict(list)
         self._prediction_counts: Dict[str, Dict[str, int]] = defaultdict(
             lambda: {"success": 0, "failure": 0}
         )
-        self._confidence_scores: Dict[str, List[float]] = defaultdict(list)
-        self._low_confidence_events: List[Dict] = []
+        self._confidence_scores: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=_WINDOW))
+        self._low_confidence_events: Deque[Dict] = deque(maxlen=100)
         
     def record_latency(self, model_name: str, latency_ms: float):
         """Record prediction latency"""
         with self._lock:
-            self._latencies[model_name].append(latency_ms)
-            # Keep only last 1000 measurements
-            if len(self._latencies[model_name]) > 1000:
-                self._latencies[model_name] = self._latencies[model_name][-1000:]
+            latencies = self._latencies[model_name]
+            ordered = self._sorted_latencies[model_name]
+            # Keep only last 1000 measurements (the deque drops the oldest)
+            if len(latencies) == _WINDOW:
+                del ordered[bisect_left(ordered, latencies[0])]
+            latencies.append(latency_ms)
+            insort(ordered, latency_ms)
     
     def record_prediction(self, model_name: str, success: bool):
         """Record prediction success/failure"""
@@ -44,13 +53,10 @@ class MetricsCollector:
     def record_confidence(self, model_name: str, confidence: float, threshold: float):
         """Record confidence score and flag low confidence predictions"""
         with self._lock:
-            self._confidence_scores[model_name].append(confidence)
-            
             # Keep only last 1000 scores
-            if len(self._confidence_scores[model_name]) > 1000:
-                self._confidence_scores[model_name] = self._confidence_scores[model_name][-1000:]
+            self._confidence_scores[model_name].append(confidence)
             
-            # Log low confidence events
+            # Log low confidence events (last 100)
             if confidence < threshold:
                 self._low_confidence_events.append({
                     "model": model_name,
@@ -58,50 +64,59 @@ class MetricsCollector:
                     "threshold": threshold,
                     "timestamp": datetime.utcnow().isoformat()
                 })
-                # Keep only last 100 events
-                if len(self._low_confidence_events) > 100:
-                    self._low_confidence_events = self._low_confidence_events[-100:]
     
     def get_latency_stats(self, model_name: str) -> Dict[str, float]:
         """Get latency statistics for a model"""
         with self._lock:
-            latencies = self._latencies.get(model_name, [])
-            if not latencies:
-                return {"count": 0}
-            
-            sorted_latencies = sorted(latencies)
-            count = len(sorted_latencies)
-            
-            return {
-                "count": count,
-                "mean": sum(sorted_latencies) / count,
-                "min": min(sorted_latencies),
-                "max": max(sorted_latencies),
-                "p50": sorted_latencies[int(count * 0.5)],
-                "p95": sorted_latencies[int(count * 0.95)],
-                "p99": sorted_latencies[int(count * 0.99)] if count > 100 else sorted_latencies[-1]
-            }
+            return self._latency_stats(model_name)
+    
+    def _latency_stats(self, model_name: str) -> Dict[str, float]:
+        """get_latency_stats body; the caller holds the lock"""
+        latencies = self._latencies.get(model_name)
+        if not latencies:
+            return {"count": 0}
+        
+        ordered = self._sorted_latencies[model_name]
+        count = len(ordered)
+        
+        return {
+            "count": count,
+            "mean": sum(latencies) / count,
+            "min": ordered[0],
+            "max": ordered[-1],
+            "p50": ordered[int(count * 0.5)],
+            "p95": ordered[int(count * 0.95)],
+            "p99": ordered[int(count * 0.99)] if count > 100 else ordered[-1]
+        }
     
     def get_prediction_counts(self, model_name: str = None) -> Dict:
         """Get prediction counts for a model or all models"""
         with self._lock:
-            if model_name:
-                return dict(self._prediction_counts.get(model_name, {"success": 0, "failure": 0}))
-            return {k: dict(v) for k, v in self._prediction_counts.items()}
+            return self._counts(model_name)
+    
+    def _counts(self, model_name: str = None) -> Dict:
+        """get_prediction_counts body; the caller holds the lock"""
+        if model_name:
+            return dict(self._prediction_counts.get(model_name, {"success": 0, "failure": 0}))
+        return {k: dict(v) for k, v in self._prediction_counts.items()}
     
     def get_confidence_stats(self, model_name: str) -> Dict[str, float]:
         """Get confidence score statistics"""
         with self._lock:
-            scores = self._confidence_scores.get(model_name, [])
-            if not scores:
-                return {"count": 0}
-            
-            return {
-                "count": len(scores),
-                "mean": sum(scores) / len(scores),
-                "min": min(scores),
-                "max": max(scores)
-            }
+            return self._confidence_stats(model_name)
+    
+    def _confidence_stats(self, model_name: str) -> Dict[str, float]:
+        """get_confidence_stats body; the caller holds the lock"""
+        scores = self._confidence_scores.get(model_name)
+        if not scores:
+            return {"count": 0}
+        
+        return {
+            "count": len(scores),
+            "mean": sum(scores) / len(scores),
+            "min": min(scores),
+            "max": max(scores)
+        }
     
     def get_low_confidence_events(self) -> List[Dict]:
         """Get recent low confidence prediction events"""
@@ -113,12 +128,12 @@ class MetricsCollector:
         with self._lock:
             return {
                 "latencies": {
-                    model: self.get_latency_stats(model)
+                    model: self._latency_stats(model)
                     for model in self._latencies.keys()
                 },
-                "predictions": self.get_prediction_counts(),
+                "predictions": self._counts(),
                 "confidence": {
-                    model: self.get_confidence_stats(model)
+                    model: self._confidence_stats(model)
                     for model in self._confidence_scores.keys()
                 },
                 "low_confidence_events": list(self._low_confidence_events)
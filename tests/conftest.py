@@ -2,20 +2,25 @@
 Test configuration and fixtures
 """
 
+import base64
+
 import pytest
 from fastapi.testclient import TestClient
 from src.api.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_client():
     """
-    FastAPI test client fixture
+    FastAPI test client fixture (one client shared by the session)
+    Entering the client runs the app lifespan once, so startup/shutdown
+    hooks are exercised the same way as in production
     """
-    return TestClient(app)
+    with TestClient(app) as client:
+        yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_brain_tumor_request():
     """
     Sample brain tumor request for testing
@@ -26,7 +31,15 @@ def sample_brain_tumor_request():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_brain_tumor_image(sample_brain_tumor_request):
+    """
+    Decoded PNG bytes of the sample brain tumor image (decoded once per session)
+    """
+    return base64.b64decode(sample_brain_tumor_request["image_base64"])
+
+
+@pytest.fixture(scope="session")
 def sample_heart_disease_request():
     """
     Sample heart disease request for testing
@@ -48,7 +61,7 @@ def sample_heart_disease_request():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_diabetes_request():
     """
     Sample diabetes request for testing
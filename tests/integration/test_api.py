@@ -4,6 +4,7 @@ Integration tests for API endpoints
 
 import pytest
 from fastapi.testclient import TestClient
+from config.settings import get_settings
 
 
 @pytest.mark.integration
@@ -58,9 +59,10 @@ def test_root_endpoint(test_client: TestClient):
 
 @pytest.mark.integration
 def test_openapi_docs(test_client: TestClient):
-    """Test that OpenAPI docs are accessible"""
+    """Test that the OpenAPI schema is served and docs are gated on debug"""
     response = test_client.get("/docs")
-    assert response.status_code == 200
+    assert response.status_code == (200 if get_settings().debug else 404)
     
     response = test_client.get("/openapi.json")
     assert response.status_code == 200
+    assert "/api/predict/heart" in response.json()["paths"]
@@ -0,0 +1,115 @@
+"""
+Unit tests for dynamic request batching
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from src.api.batching import DynamicBatcher
+
+
+@pytest.mark.unit
+def test_dynamic_batcher_merges_concurrent_requests():
+    """Test concurrent submissions share one predict call"""
+    batch_sizes = []
+
+    def predict(batch):
+        batch_sizes.append(len(batch))
+        return batch * 2
+
+    async def run():
+        batcher = DynamicBatcher("test_model", max_batch_size=8, max_latency_ms=50, predict_fn=predict)
+        inputs = [np.full((1, 3), i, dtype=np.float32) for i in range(5)]
+        results = await asyncio.gather(*(batcher.submit(x) for x in inputs))
+        await batcher.stop()
+        return inputs, results
+
+    inputs, results = asyncio.run(run())
+    assert batch_sizes == [5]
+    for x, result in zip(inputs, results):
+        assert np.array_equal(result, x * 2)
+
+
+@pytest.mark.unit
+def test_dynamic_batcher_propagates_errors():
+    """Test a failing batch raises in every waiting request"""
+    def predict(batch):
+        raise RuntimeError("model failed")
+
+    async def run():
+        batcher = DynamicBatcher("test_model", max_latency_ms=5, predict_fn=predict)
+        try:
+            return await asyncio.gather(
+                batcher.submit(np.zeros((1, 2))),
+                batcher.submit(np.zeros((1, 2))),
+                return_exceptions=True
+            )
+        finally:
+            await batcher.stop()
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.unit
+def test_dynamic_batcher_rejects_when_queue_full():
+    """Test a bounded queue raises QueueFull instead of waiting"""
+    async def run():
+        batcher = DynamicBatcher("test_model", max_queue_size=1, predict_fn=lambda batch: batch)
+        first = asyncio.ensure_future(batcher.submit(np.zeros((1, 2))))
+        second = asyncio.ensure_future(batcher.submit(np.zeros((1, 2))))
+        await asyncio.sleep(0)
+        with pytest.raises(asyncio.QueueFull):
+            await second
+        await first
+        await batcher.stop()
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_dynamic_batcher_isolates_mismatched_shapes():
+    """Test an odd-shaped input runs separately instead of failing the batch"""
+    batch_shapes = []
+
+    def predict(batch):
+        if batch.shape[1:] != (3,):
+            raise ValueError("wrong input shape")
+        batch_shapes.append(batch.shape)
+        return batch * 2
+
+    async def run():
+        batcher = DynamicBatcher("test_model", max_latency_ms=50, predict_fn=predict)
+        try:
+            return await asyncio.gather(
+                batcher.submit(np.ones((1, 3))),
+                batcher.submit(np.ones((1, 4))),
+                batcher.submit(np.ones((1, 3))),
+                return_exceptions=True
+            )
+        finally:
+            await batcher.stop()
+
+    results = asyncio.run(run())
+    assert batch_shapes == [(2, 3)]
+    assert np.array_equal(results[0], np.full((1, 3), 2.0))
+    assert isinstance(results[1], ValueError)
+    assert np.array_equal(results[2], np.full((1, 3), 2.0))
+
+
+@pytest.mark.unit
+def test_dynamic_batcher_flushes_lone_request_immediately():
+    """Test a single request does not wait out the batching window"""
+    async def run():
+        batcher = DynamicBatcher("test_model", max_latency_ms=500, predict_fn=lambda batch: batch)
+        try:
+            start = time.perf_counter()
+            await batcher.submit(np.zeros((1, 2)))
+            return time.perf_counter() - start
+        finally:
+            await batcher.stop()
+
+    assert asyncio.run(run()) < 0.1
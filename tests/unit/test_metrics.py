@@ -62,3 +62,21 @@ def test_latency_timer():
     
     stats = collector.get_latency_stats("test_model")
     assert stats["count"] == 1
+
+
+@pytest.mark.unit
+def test_metrics_collector_latency_window():
+    """Test latency stats and percentiles cover only the last 1000 values"""
+    collector = MetricsCollector()
+    for latency in range(1, 1501):
+        collector.record_latency("test_model", float(latency))
+    
+    stats = collector.get_latency_stats("test_model")
+    assert stats["count"] == 1000
+    assert stats["min"] == 501.0
+    assert stats["max"] == 1500.0
+    assert stats["p50"] == 1001.0
+    assert stats["p99"] == 1491.0
+    
+    # get_all_metrics reuses the per-model stats under the same lock
+    assert collector.get_all_metrics()["latencies"]["test_model"] == stats
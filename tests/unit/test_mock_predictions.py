@@ -0,0 +1,89 @@
+"""
+Unit tests for the mock prediction engine
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from src.models.mock_predictions import DIABETES_FEATURES, HEART_FEATURES, LIVER_FEATURES, mock_engine
+
+BATCH_CASES = {
+    "heart": (
+        mock_engine.predict_heart_disease_batch,
+        mock_engine.predict_heart_disease,
+        HEART_FEATURES,
+        itertools.product(
+            [30, 45, 54, 55, 65, 80],
+            [150, 170, 200, 239, 240, 280],
+            [110, 120, 130, 140, 159, 160],
+            [0, 1, 2, 3],
+            [0, 1],
+        ),
+    ),
+    "diabetes": (
+        mock_engine.predict_diabetes_batch,
+        mock_engine.predict_diabetes,
+        DIABETES_FEATURES,
+        itertools.product(
+            [85.0, 90.0, 99.5, 100.0, 115.0, 126.0, 148.0],
+            [18.0, 22.9, 23.0, 25.0, 27.5, 30.0, 35.0],
+            [30, 45, 55, 65],
+            [80, 85, 95],
+        ),
+    ),
+    "liver": (
+        mock_engine.predict_liver_disease_batch,
+        mock_engine.predict_liver_disease,
+        LIVER_FEATURES,
+        itertools.product(
+            [40],
+            [0.7, 1.2, 1.9, 2.0],
+            [70, 150],
+            [25, 60, 100],
+            [25, 60, 100],
+        ),
+    ),
+}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("name", list(BATCH_CASES))
+def test_batch_matches_single_predictions(name):
+    """Test the vectorized batch paths agree with the scalar rules"""
+    predict_batch, predict, features, grid = BATCH_CASES[name]
+    rows = np.array(list(grid), dtype=np.float64)
+
+    batch = predict_batch(rows)
+
+    assert len(batch) == len(rows)
+    for row, result in zip(rows.tolist(), batch):
+        assert dict(result) == dict(predict(dict(zip(features, row))))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("predict_batch", [
+    mock_engine.predict_brain_tumor_batch,
+    mock_engine.predict_kidney_disease_batch,
+])
+def test_seeded_image_batches_are_reproducible(predict_batch):
+    """Test seeded batch draws repeat and stay within the class confidence ranges"""
+    results = predict_batch(500, seed=42)
+
+    assert results == predict_batch(500, seed=42)
+    assert all(0.75 <= r["confidence"] <= 0.95 for r in results)
+
+
+@pytest.mark.unit
+def test_heart_scores_match_batch_risk_scores():
+    """Test the score-only cohort path agrees with the full batch results"""
+    rng = np.random.default_rng(0)
+    rows = np.column_stack([
+        rng.integers(20, 90, 2000), rng.integers(120, 320, 2000), rng.integers(90, 200, 2000),
+        rng.integers(0, 4, 2000), rng.integers(0, 2, 2000),
+    ])
+
+    scores = mock_engine.heart_disease_scores(rows)
+
+    assert scores.tolist() == [r["risk_score"] for r in mock_engine.predict_heart_disease_batch(rows)]
@@ -0,0 +1,32 @@
+"""
+Unit tests for the model version registry
+"""
+
+import pytest
+
+from src.models.registry import ModelRegistry
+
+
+@pytest.mark.unit
+def test_metadata_copies_are_independent(tmp_path):
+    """Test mutating loaded metadata never changes the cached parse"""
+    registry = ModelRegistry(models_dir=str(tmp_path))
+    registry.save_metadata("heart", {"name": "heart", "metrics": {"accuracy": 0.9}}, version="v1")
+
+    metadata = registry.load_metadata("heart", "v1")
+    metadata["metrics"]["accuracy"] = 0.1
+
+    assert registry.load_metadata("heart", "v1")["metrics"]["accuracy"] == 0.9
+
+
+@pytest.mark.unit
+def test_active_version_follows_other_instances(tmp_path):
+    """Test a version switch saved by one registry is seen by another"""
+    serving = ModelRegistry(models_dir=str(tmp_path))
+    admin = ModelRegistry(models_dir=str(tmp_path))
+    assert serving.get_active_version("heart") == "v1"
+
+    admin.set_active_version("heart", "v2")
+
+    assert serving.get_active_version("heart") == "v2"
+    assert {m["name"]: m["active_version"] for m in serving.list_all_models()}["heart"] == "v2"
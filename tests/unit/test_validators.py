@@ -0,0 +1,102 @@
+"""
+Unit tests for data validation statistics
+"""
+
+import numpy as np
+import pytest
+
+from src.data import validators
+
+
+def _sample(with_nans: bool) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    data = rng.normal(50.0, 5.0, size=(40, 25))
+    data[3, 4] = 500.0
+    data[7, 1] = -400.0
+    if with_nans:
+        data[::9, 2] = np.nan
+    return data
+
+
+def _reference(data: np.ndarray, threshold: float = 3.0) -> dict:
+    values = data.ravel()
+    finite = values[~np.isnan(values)]
+    std = float(finite.std())
+    outliers = int(np.count_nonzero(np.abs(finite - finite.mean()) > threshold * std)) if std else 0
+    return {
+        "total_values": data.size,
+        "missing_count": int(np.isnan(values).sum()),
+        "std": std,
+        "outlier_count": outliers,
+        "min": float(finite.min()),
+        "max": float(finite.max()),
+    }
+
+
+def _assert_matches(missing, std, lowest, highest, outliers, expected):
+    assert missing == expected["missing_count"]
+    assert std == pytest.approx(expected["std"], rel=1e-12)
+    assert lowest == expected["min"]
+    assert highest == expected["max"]
+    assert outliers == expected["outlier_count"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("with_nans", [False, True])
+def test_scan_matches_numpy_reference(monkeypatch, with_nans):
+    """Test the NumPy scan path against a direct NumPy computation"""
+    monkeypatch.setattr(validators, "_scan_kernel", None)
+    data = _sample(with_nans)
+    stats = validators._scan(data)
+    expected = _reference(data)
+    assert stats["total_values"] == expected["total_values"]
+    _assert_matches(
+        stats["missing_count"], stats["std"], stats["min"], stats["max"], stats["outlier_count"], expected
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("with_nans", [False, True])
+def test_scan_loop_matches_numpy_reference(with_nans):
+    """Test the scalar kernel source (run as plain Python) against NumPy"""
+    data = _sample(with_nans)
+    _assert_matches(*validators._scan_loop(data.ravel(), 3.0), _reference(data))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("with_nans", [False, True])
+def test_numba_scan_kernel_matches_numpy_reference(with_nans):
+    """Test the numba-compiled kernel against NumPy"""
+    pytest.importorskip("numba")
+    data = _sample(with_nans)
+    _assert_matches(*validators._scan_kernel(data.ravel(), 3.0), _reference(data))
+
+
+@pytest.mark.unit
+def test_scan_all_missing(monkeypatch):
+    """Test an all-NaN input reports only missing values"""
+    monkeypatch.setattr(validators, "_scan_kernel", None)
+    stats = validators._scan(np.full(6, np.nan))
+    assert stats["missing_count"] == 6
+    assert stats["std"] == 0.0
+    assert stats["outlier_count"] == 0
+    assert np.isnan(stats["min"]) and np.isnan(stats["max"])
+    assert validators._scan_loop(np.full(6, np.nan), 3.0)[:2] == (6, 0.0)
+
+
+@pytest.mark.unit
+def test_numba_scan_kernel_is_compiled_at_import():
+    """Test importing the module leaves a compiled kernel behind"""
+    pytest.importorskip("numba")
+    assert validators._scan_kernel.signatures
+
+
+@pytest.mark.unit
+def test_validate_empty_input():
+    """Test a zero-size array validates without dividing by zero"""
+    results = validators.DataValidator.validate_input_data(np.array([]), expected_min=0.0, expected_max=1.0)
+    missing, outliers, ranges = results["checks"]
+    assert missing["missing_count"] == 0
+    assert missing["missing_percentage"] == 0.0
+    assert outliers["outlier_count"] == 0
+    assert ranges["is_valid"]
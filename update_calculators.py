@@ -1,81 +1,142 @@
 # Quick script to update all calculator pages with new theme
-import os
+import hashlib
+import json
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 
 calc_dir = r"c:/Users/prakh/OneDrive/Desktop/health ai/OpenHealth/templates/calculators"
+base = Path(calc_dir)
 
 files = ["diabetes.html", "liver.html", "breast_cancer.html", "parkinsons.html", "kidney.html", "brain_tumor.html"]
 
-for filename in files:
-    filepath = os.path.join(calc_dir, filename)
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Fix navbar - move home link to left
-    content = re.sub(
-        r'<div class="nav-content">\s*<div class="logo">',
-        '<div class="nav-content">\n            <a href="/" class="back-link">← Home</a>\n            <div class="logo">',
-        content
-    )
-    content = re.sub(
-        r'</div>\s*<a href="/" style="color: rgba\(255,255,255,0\.7\); text-decoration: none; font-size: 14px;">← Home</a>',
-        '</div>',
-        content
-    )
-    
-    # Update nav-content styling
-    content = re.sub(
-        r'justify-content: space-between;\s*align-items: center;',
-        'align-items: center;\n            gap: 24px;',
-        content
-    )
-    
-    # Add margin-left: auto to logo
-    content = re.sub(
-        r'(\.logo \{[^}]*gap: 8px;)',
-        r'\1\n            margin-left: auto;',
-        content
-    )
-    
-    # Update badge color to purple gradient
-    content = re.sub(
-        r'background: #007AFF;(\s*padding: 2px 8px;)',
-        r'background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\1',
-        content
-    )
-    
-    # Add back-link styles after badge
-    if '.back-link' not in content:
-        content = re.sub(
-            r'(\.badge \{[^}]*\})',
-            r'\1\n        .back-link {\n            color: rgba(255,255,255,0.8);\n            text-decoration: none;\n            font-size: 14px;\n            font-weight: 500;\n            transition: all 0.2s;\n        }\n        .back-link:hover {\n            color: #fff;\n        }',
-            content
-        )
-    
-    # Update button color to purple gradient
-    content = re.sub(
-        r'background: #007AFF;(\s*color: #fff;\s*padding: 14px)',
-        r'background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\1',
-        content
-    )
-    
-    # Update button hover
-    content = re.sub(
-        r'background: #0051D5;\s*transform: translateY\(-1px\);',
-        'background: linear-gradient(135deg, #5568d3 0%, #6a3f8f 100%);\n            transform: translateY(-1px);\n            box-shadow: 0 8px 20px rgba(102, 126, 234, 0.3);',
-        content
-    )
-    
-    # Update input focus border
-    content = re.sub(
-        r'border-color: #007AFF;',
-        'border-color: #667eea;',
-        content
+# (mtime, size) of each page after the last run; pages that have not been
+# touched since are skipped without being read. Kept beside this script
+# (and git-ignored) rather than next to the served templates
+cache_path = Path(__file__).with_name(".theme_cache.json")
+
+GRADIENT = 'background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);'
+BACK_LINK_CSS = '\n        .back-link {\n            color: rgba(255,255,255,0.8);\n            text-decoration: none;\n            font-size: 14px;\n            font-weight: 500;\n            transition: all 0.2s;\n        }\n        .back-link:hover {\n            color: #fff;\n        }'
+
+# Theme edits as (group name, literal the edit needs, pattern); the edits
+# that can apply are joined into one alternation, so each file is scanned
+# once and the named group that matched picks the replacement
+THEME_RULES = (
+    ('nav', '<div class="nav-content">', r'(?P<nav><div class="nav-content">\s*<div class="logo">)'),
+    ('home', '← Home</a>', r'(?P<home></div>\s*<a href="/" style="color: rgba\(255,255,255,0\.7\); text-decoration: none; font-size: 14px;">← Home</a>)'),
+    ('justify', 'space-between;', r'(?P<justify>justify-content: space-between;\s*align-items: center;)'),
+    ('logo', '.logo {', r'(?P<logo>\.logo \{[^}]*gap: 8px;)(?!\s*margin-left: auto;)'),
+    ('badge_block', '.badge {', r'(?P<badge_block>\.badge \{[^}]*\})'),
+    ('badge', '#007AFF', r'background: #007AFF;(?P<badge>\s*padding: 2px 8px;)'),
+    ('button', '#007AFF', r'background: #007AFF;(?P<button>\s*color: #fff;\s*padding: 14px)'),
+    ('hover', '#0051D5', r'(?P<hover>background: #0051D5;\s*transform: translateY\(-1px\);)'),
+)
+
+
+@lru_cache(maxsize=None)
+def theme_pattern(names):
+    return re.compile('|'.join(pattern for name, _, pattern in THEME_RULES if name in names))
+
+
+def apply_theme(content):
+    """Apply every theme edit to content in a single scan"""
+    # Back-link styles are only added once; without that edit the whole
+    # .badge rule no longer needs matching
+    add_back_link = '.back-link' not in content
+    names = tuple(
+        name for name, literal, _ in THEME_RULES
+        if literal in content and (add_back_link or name != 'badge_block')
     )
-    
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print(f"✅ Updated {filename}")
 
-print("\n🎉 All calculator pages updated!")
+    def replace(m):
+        nonlocal add_back_link
+        name = m.lastgroup
+        # Fix navbar - move home link to left
+        if name == 'nav':
+            return '<div class="nav-content">\n            <a href="/" class="back-link">← Home</a>\n            <div class="logo">'
+        if name == 'home':
+            return '</div>'
+        # Update nav-content styling
+        if name == 'justify':
+            return 'align-items: center;\n            gap: 24px;'
+        # Add margin-left: auto to logo (edits inside the rule still apply)
+        if name == 'logo':
+            return '.logo {' + pattern.sub(replace, m.group()[7:]) + '\n            margin-left: auto;'
+        # Add back-link styles after the first badge rule only (edits inside
+        # the rule still apply)
+        if name == 'badge_block':
+            block = '.badge {' + pattern.sub(replace, m.group()[8:])
+            if not add_back_link:
+                return block
+            add_back_link = False
+            return block + BACK_LINK_CSS
+        # Update badge and button color to purple gradient
+        if name in ('badge', 'button'):
+            return GRADIENT + m.group(name)
+        # Update button hover
+        return 'background: linear-gradient(135deg, #5568d3 0%, #6a3f8f 100%);\n            transform: translateY(-1px);\n            box-shadow: 0 8px 20px rgba(102, 126, 234, 0.3);'
+
+    if names:
+        pattern = theme_pattern(names)
+        content = pattern.sub(replace, content)
+
+    # Update input focus border (a plain literal, so str.replace is enough)
+    return content.replace('border-color: #007AFF;', 'border-color: #667eea;')
+
+
+# Editing this script (patterns or replacements) invalidates the cache
+with open(__file__, 'rb') as f:
+    THEME_KEY = hashlib.sha1(f.read()).hexdigest()
+
+
+def load_cache():
+    """Stamps recorded by the last run with the current theme (empty if none)"""
+    try:
+        cache = json.loads(cache_path.read_text(encoding='utf-8'))
+    except (FileNotFoundError, ValueError):
+        return {}
+    if cache.get("theme") != THEME_KEY or cache.get("calc_dir") != calc_dir:
+        return {}
+    return cache.get("files", {})
+
+
+def stamp(filepath):
+    st = filepath.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def process(filename, seen):
+    """Theme one calculator page and return its status line and stamp"""
+    filepath = base / filename
+    current = stamp(filepath)
+    if seen.get(filename) == current:
+        return f"⏭️  {filename} already themed, skipped", current
+
+    content = filepath.read_text(encoding='utf-8')
+
+    themed = apply_theme(content)
+    if themed == content:
+        return f"⏭️  {filename} unchanged, skipped", current
+
+    filepath.write_text(themed, encoding='utf-8')
+
+    return f"✅ Updated {filename}", stamp(filepath)
+
+
+seen = load_cache()
+stamps = {}
+report = []
+
+# Pages are independent, so they are processed concurrently;
+# status lines are kept in file order and written out in one go
+with ThreadPoolExecutor(max_workers=len(files)) as executor:
+    for filename, (status, current) in zip(files, executor.map(process, files, [seen] * len(files))):
+        stamps[filename] = current
+        report.append(status)
+
+cache_path.write_text(json.dumps({"theme": THEME_KEY, "calc_dir": calc_dir, "files": stamps}, indent=2), encoding='utf-8')
+
+report.append("\n🎉 All calculator pages updated!\n")
+sys.stdout.write("\n".join(report))